@@ -0,0 +1,10 @@
+"""Safe YAML loader shared by the PRISM config modules."""
+
+# libyaml's C loader when PyYAML was built with it, the pure-Python loader
+# otherwise
+try:
+    from yaml import CSafeLoader as SafeYamlLoader
+except ImportError:
+    from yaml import SafeLoader as SafeYamlLoader
+
+__all__ = ["SafeYamlLoader"]
@@ -4,6 +4,9 @@ from typing import Literal
 
 from pydantic import BaseModel, field_validator
 
+# Choices that carry user-visible text and so must include content
+_CONTENT_REQUIRED = frozenset(("REPLY", "RESHARE"))
+
 
 class AgentDecision(BaseModel):
     """Structured output of a social agent's decision."""
@@ -23,6 +26,6 @@ class AgentDecision(BaseModel):
     @classmethod
     def content_required_for_reply_reshare(cls, v: str | None, info) -> str | None:
         choice = info.data.get("choice")
-        if choice in ("REPLY", "RESHARE") and (v is None or not v.strip()):
+        if choice in _CONTENT_REQUIRED and (v is None or not v.strip()):
             raise ValueError(f"content is required when choice is {choice}")
         return v
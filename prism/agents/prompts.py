@@ -1,24 +1,9 @@
 """Prompt templates for social agent decision-making."""
 
+from functools import lru_cache
 
-def build_system_prompt(name: str, interests: list[str], personality: str) -> str:
-    """Build the system prompt for a social agent.
-
-    Args:
-        name: The agent's display name.
-        interests: List of topics the agent cares about.
-        personality: Brief personality description.
-
-    Returns:
-        System prompt string for the agent.
-    """
-    interests_str = ", ".join(interests)
-
-    return f"""You are {name}, a social media user with the following profile:
-
-Interests: {interests_str}
-Personality: {personality}
-
+# Profile-independent instructions appended to every system prompt
+_SYSTEM_PROMPT_TAIL = """\
 You are browsing your social media feed. For each post you see, you must decide
 what action to take.
 
@@ -35,11 +20,11 @@ Decision criteria:
 - SCROLL past posts that don't interest you or aren't worth engaging with
 
 You MUST respond with valid JSON in this exact format:
-{{
+{
   "choice": "LIKE" | "REPLY" | "RESHARE" | "SCROLL",
   "reason": "1-3 sentence explanation of your decision",
   "content": "Your reply or reshare comment (required for REPLY/RESHARE)"
-}}
+}
 
 Important:
 - Always include a reason for your decision
@@ -48,6 +33,46 @@ Important:
 - Stay in character based on your personality and interests"""
 
 
+def build_system_prompt(name: str, interests: list[str], personality: str) -> str:
+    """Build the system prompt for a social agent.
+
+    Args:
+        name: The agent's display name.
+        interests: List of topics the agent cares about.
+        personality: Brief personality description.
+
+    Returns:
+        System prompt string for the agent.
+    """
+    return _render_system_prompt(name, tuple(interests), personality)
+
+
+@lru_cache(maxsize=1024)
+def _render_system_prompt(
+    name: str, interests: tuple[str, ...], personality: str
+) -> str:
+    """Render the system prompt, cached per profile.
+
+    Agents generated from the same profile share the rendered string.
+
+    Args:
+        name: The agent's display name.
+        interests: Topics the agent cares about, as a hashable tuple.
+        personality: Brief personality description.
+
+    Returns:
+        System prompt string for the agent.
+    """
+    interests_str = ", ".join(interests)
+
+    return f"""You are {name}, a social media user with the following profile:
+
+Interests: {interests_str}
+Personality: {personality}
+
+{_SYSTEM_PROMPT_TAIL}"""
+
+
 def build_feed_prompt(feed_text: str) -> str:
     """Build the user prompt containing the feed content.
 
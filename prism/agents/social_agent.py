@@ -5,6 +5,7 @@ import logging
 from datetime import datetime, timezone
 
 from agent_framework.ollama import OllamaChatClient
+from pydantic import ValidationError
 
 from prism.agents.decision import AgentDecision
 from prism.agents.prompts import build_feed_prompt, build_system_prompt
@@ -13,6 +14,30 @@ from prism.statechart.transitions import StateTransition
 
 logger = logging.getLogger(__name__)
 
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _embedded_json_object(text: str) -> str | None:
+    """Find the JSON object embedded in surrounding text.
+
+    Decodes forward from the first "{" so nested braces and braces inside
+    strings are handled by the JSON scanner rather than pattern matching.
+
+    Args:
+        text: Raw text that may wrap a JSON object in prose or a code fence.
+
+    Returns:
+        The object's source text, or None if no object starts at the first "{".
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    try:
+        _, end = _JSON_DECODER.raw_decode(text, start)
+    except json.JSONDecodeError:
+        return None
+    return text[start:end]
+
 
 class SocialAgent:
     """A social media agent that decides how to engage with feed content.
@@ -134,15 +159,43 @@ class SocialAgent:
             AgentDecision parsed from the text.
         """
         try:
-            # Try to parse as JSON
-            data = json.loads(text)
-            return AgentDecision(**data)
-        except json.JSONDecodeError as e:
-            logger.warning(f"JSON parse error for agent {self.agent_id}: {e}")
-            return self._default_scroll_decision(f"JSON parse error: {e}")
-        except Exception as e:
-            logger.warning(f"Validation error for agent {self.agent_id}: {e}")
-            return self._default_scroll_decision(f"Validation error: {e}")
+            # Parse and validate in one pass; malformed JSON, non-object
+            # payloads and missing text all surface as ValidationError
+            return AgentDecision.model_validate_json(text)
+        except ValidationError as e:
+            if e.errors()[0]["type"] != "json_invalid":
+                return self._invalid_response_decision(e)
+
+            # The model may wrap its JSON in prose; retry on the embedded object
+            embedded = _embedded_json_object(text)
+            if embedded is None:
+                return self._invalid_response_decision(e)
+
+        # raw_decode accepts some text the validator rejects (e.g. lone
+        # surrogates), so the embedded object gets exactly one attempt
+        try:
+            return AgentDecision.model_validate_json(embedded)
+        except ValidationError as e:
+            return self._invalid_response_decision(e)
+
+    def _invalid_response_decision(self, error: ValidationError) -> AgentDecision:
+        """Log an unusable LLM response and fall back to SCROLL.
+
+        Args:
+            error: The ValidationError raised while parsing the response.
+
+        Returns:
+            AgentDecision with SCROLL choice and the failure as its reason.
+        """
+        details = error.errors()[0]
+        if details["type"] == "json_invalid":
+            logger.warning(
+                f"JSON parse error for agent {self.agent_id}: {details['msg']}"
+            )
+            return self._default_scroll_decision(f"JSON parse error: {details['msg']}")
+
+        logger.warning(f"Validation error for agent {self.agent_id}: {error}")
+        return self._default_scroll_decision(f"Validation error: {error}")
 
     def _default_scroll_decision(self, reason: str) -> AgentDecision:
         """Create a default SCROLL decision for error cases.
@@ -184,14 +237,18 @@ class SocialAgent:
 
         Records the transition in history and resets tick counter.
         No-op if new_state equals current state (self-transition).
+        new_state is coerced to the AgentState singleton so downstream
+        code can compare states by identity.
 
         Args:
             new_state: The target AgentState to transition to.
             trigger: The event that caused this transition.
             context: Optional context dict (e.g., post_id, relevance).
         """
+        new_state = AgentState(new_state)
+
         # No-op for self-transitions
-        if new_state == self.state:
+        if new_state is self.state:
             return
 
         # Record the transition
@@ -1,11 +1,13 @@
 """LLM configuration models and YAML loading."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
 import yaml
 from pydantic import BaseModel, Field
 
+from prism._yaml import SafeYamlLoader
 from prism.rag.config import RAGConfig
 
 
@@ -45,10 +47,26 @@ def load_config(path: str | Path = "configs/default.yaml") -> PrismConfig:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path) as f:
-        raw = yaml.safe_load(f)
+    # Reading the bytes is cheap; the parse is cached per file content
+    raw = _parse_yaml(config_path.read_bytes())
 
     if raw is None:
         return PrismConfig()
 
     return PrismConfig(**raw)
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml(content: bytes) -> dict | None:
+    """Parse a YAML document, cached by its content.
+
+    The result is shared between calls, so callers must not mutate it;
+    load_config validates it into a fresh PrismConfig each time.
+
+    Args:
+        content: Raw bytes of the YAML file.
+
+    Returns:
+        The parsed YAML document, or None for an empty file.
+    """
+    return yaml.load(content, Loader=SafeYamlLoader)
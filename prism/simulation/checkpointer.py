@@ -156,6 +156,7 @@ class Checkpointer:
         """
         from prism.rag.models import Post
         from prism.simulation.state import EngagementMetrics, SimulationState
+        from prism.statechart.states import AgentState
 
         with open(path) as f:
             data = json.load(f)
@@ -171,6 +172,10 @@ class Checkpointer:
         # Reconstruct agents
         if agent_factory:
             agents = [agent_factory(a) for a in data["agents"]]
+            # Coerce states to AgentState singletons; downstream code
+            # compares states by identity
+            for agent in agents:
+                agent.state = AgentState(agent.state)
         else:
             # Return agent dicts as-is (for testing or deferred reconstruction)
             agents = data["agents"]
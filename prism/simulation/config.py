@@ -11,6 +11,8 @@ from typing import Any
 import yaml
 from pydantic import BaseModel, Field, field_validator
 
+from prism._yaml import SafeYamlLoader
+
 
 class SimulationConfig(BaseModel):
     """Configuration for simulation execution.
@@ -61,7 +63,7 @@ def load_config(path: Path) -> SimulationConfig:
         SimulationConfig with values from the file or defaults.
     """
     with open(path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=SafeYamlLoader)
 
     simulation_data = data.get("simulation", {}) if data else {}
     return SimulationConfig(**simulation_data)
@@ -76,7 +76,9 @@ class RoundController:
     async def run_round(self, state: "SimulationState") -> RoundResult:
         """Execute a single simulation round.
 
-        Processes all agents in the state via the round executor.
+        Processes all agents in the state via the round executor. Any
+        per-round reasoner cache is cleared first so coalesced decisions
+        never leak across round boundaries.
 
         Args:
             state: Current simulation state.
@@ -84,6 +86,10 @@ class RoundController:
         Returns:
             RoundResult with decisions from all agents.
         """
+        clear_round_cache = getattr(state.reasoner, "clear_round_cache", None)
+        if clear_round_cache is not None:
+            clear_round_cache()
+
         decisions = []
 
         for agent in state.agents:
@@ -97,7 +97,7 @@ class AgentDecisionExecutor:
             # else: no valid targets - stay in current state
 
         # 5. Transition agent to new state (if changed)
-        if new_state is not None and new_state != agent.state:
+        if new_state is not None and new_state is not agent.state:
             ctx = {"round": state.round_number}
             agent.transition_to(new_state, trigger, context=ctx)
         else:
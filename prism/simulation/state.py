@@ -4,27 +4,31 @@ This module defines the core state models for simulation execution including
 EngagementMetrics for tracking cumulative engagement and SimulationState
 as the single source of truth during simulation.
 
+Both are slotted dataclasses rather than Pydantic models: they are mutated
+many times per round and only serialized at checkpoints, where
+prism.simulation.checkpointer.CheckpointData is the Pydantic boundary.
+
 Type Safety Note:
-    The agents and reasoner fields use Any at runtime for Pydantic compatibility,
-    but are expected to conform to SocialAgentProtocol and StatechartReasonerProtocol
+    The agents and reasoner fields are typed as Any, but are expected to
+    conform to SocialAgentProtocol and StatechartReasonerProtocol
     respectively. See prism.simulation.protocols for the expected interfaces.
 """
 
+from dataclasses import dataclass, field, fields
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
-
 from prism.rag.models import Post
 from prism.statechart.queries import state_distribution
 from prism.statechart.statechart import Statechart
 from prism.statechart.states import AgentState
 
 
-class EngagementMetrics(BaseModel):
+@dataclass(slots=True)
+class EngagementMetrics:
     """Cumulative engagement metrics for simulation analysis.
 
     Tracks total likes, reshares, replies, and posts created across
-    all agents during the simulation. All fields have ge=0 constraint.
+    all agents during the simulation. All fields must be >= 0.
 
     Attributes:
         total_likes: Cumulative number of likes.
@@ -33,10 +37,20 @@ class EngagementMetrics(BaseModel):
         posts_created: Number of posts created during simulation.
     """
 
-    total_likes: int = Field(default=0, ge=0)
-    total_reshares: int = Field(default=0, ge=0)
-    total_replies: int = Field(default=0, ge=0)
-    posts_created: int = Field(default=0, ge=0)
+    total_likes: int = 0
+    total_reshares: int = 0
+    total_replies: int = 0
+    posts_created: int = 0
+
+    def __post_init__(self) -> None:
+        """Validate that all counters are non-negative.
+
+        Raises:
+            ValueError: If any counter is negative.
+        """
+        for f in fields(self):
+            if getattr(self, f.name) < 0:
+                raise ValueError(f"{f.name} must be >= 0")
 
     def increment_like(self) -> None:
         """Increment total_likes by 1."""
@@ -55,7 +69,8 @@ class EngagementMetrics(BaseModel):
         self.posts_created += 1
 
 
-class SimulationState(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class SimulationState:
     """Single source of truth for simulation execution.
 
     Contains all data needed by executors including posts, agents,
@@ -70,32 +85,21 @@ class SimulationState(BaseModel):
         reasoner: Optional LLM reasoner for ambiguous state transitions.
     """
 
-    model_config = {"arbitrary_types_allowed": True}
-
-    posts: list[Post] = Field(default_factory=list)
-    agents: list[Any] = Field(default_factory=list)
-    round_number: int = Field(default=0)
-    metrics: EngagementMetrics = Field(default_factory=EngagementMetrics)
+    posts: list[Post] = field(default_factory=list)
+    agents: list[Any] = field(default_factory=list)
+    round_number: int = 0
+    metrics: EngagementMetrics = field(default_factory=EngagementMetrics)
     statechart: Statechart
     reasoner: Any = None
 
-    @field_validator("agents")
-    @classmethod
-    def validate_agents_not_empty(cls, v: list[Any]) -> list[Any]:
+    def __post_init__(self) -> None:
         """Validate that agents list is not empty.
 
-        Args:
-            v: The agents list to validate.
-
-        Returns:
-            The validated agents list.
-
         Raises:
             ValueError: If agents list is empty.
         """
-        if not v:
+        if not self.agents:
             raise ValueError("agents list must not be empty")
-        return v
 
     def get_state_distribution(self) -> dict[AgentState, int]:
         """Get distribution of agents across states.
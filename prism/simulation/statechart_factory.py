@@ -16,7 +16,8 @@ def create_social_media_statechart() -> Statechart:
     agents browsing and interacting with social media content.
 
     Returns:
-        A Statechart instance configured for social media behavior.
+        A Statechart instance configured for social media behavior, with
+        fire() already compiled via Statechart.compile().
     """
     states = set(AgentState)
     transitions: list[Transition] = [
@@ -130,8 +131,11 @@ def create_social_media_statechart() -> Statechart:
         ),
     ]
 
-    return Statechart(
+    statechart = Statechart(
         states=states,
         transitions=transitions,
         initial=AgentState.IDLE,
     )
+    # The chart is fixed, so specialize fire() once up front
+    statechart.compile()
+    return statechart
@@ -4,12 +4,22 @@ This module provides the determine_trigger function that maps agent state
 and context to the appropriate trigger name for statechart transitions.
 """
 
+import sys
 from typing import Any
 
 from prism.rag.models import Post
 from prism.simulation.state import SimulationState
 from prism.statechart.states import AgentState
 
+# Interned trigger names, matching the interned triggers held by Statechart
+_START_BROWSING = sys.intern("start_browsing")
+_SEES_POST = sys.intern("sees_post")
+_FEED_EMPTY = sys.intern("feed_empty")
+_DECIDES = sys.intern("decides")
+_FINISHES_COMPOSING = sys.intern("finishes_composing")
+_FINISHES_ENGAGING = sys.intern("finishes_engaging")
+_RESTED = sys.intern("rested")
+
 
 def determine_trigger(
     agent: Any,
@@ -33,22 +43,22 @@ def determine_trigger(
 
     match current_state:
         case AgentState.IDLE:
-            return "start_browsing"
+            return _START_BROWSING
         case AgentState.SCROLLING:
             if feed:
-                return "sees_post"
-            return "feed_empty"
+                return _SEES_POST
+            return _FEED_EMPTY
         case AgentState.EVALUATING:
-            return "decides"
+            return _DECIDES
         case AgentState.COMPOSING:
-            return "finishes_composing"
+            return _FINISHES_COMPOSING
         case (
             AgentState.ENGAGING_LIKE
             | AgentState.ENGAGING_REPLY
             | AgentState.ENGAGING_RESHARE
         ):
-            return "finishes_engaging"
+            return _FINISHES_ENGAGING
         case AgentState.RESTING:
-            return "rested"
+            return _RESTED
         case _:
-            return "start_browsing"
+            return _START_BROWSING
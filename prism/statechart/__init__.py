@@ -11,9 +11,10 @@ Exports:
     StatechartReasoner: LLM-based reasoner for ambiguous transitions
     agents_in_state: Query function to count agents in a specific state
     state_distribution: Query function to get state distribution across agents
+    pack_states: Pack agent states into an int8 column for vectorized queries
 """
 
-from prism.statechart.queries import agents_in_state, state_distribution
+from prism.statechart.queries import agents_in_state, pack_states, state_distribution
 from prism.statechart.reasoner import StatechartReasoner
 from prism.statechart.statechart import Statechart
 from prism.statechart.states import AgentState
@@ -27,4 +28,5 @@ __all__ = [
     "StatechartReasoner",
     "agents_in_state",
     "state_distribution",
+    "pack_states",
 ]
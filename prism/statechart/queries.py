@@ -2,27 +2,65 @@
 
 This module provides utility functions for querying and analyzing
 the state distribution of agents in a simulation.
+
+For large populations, callers can pack agent states once into an int8
+column with pack_states() and pass it to the query functions, which then
+count with vectorized NumPy reductions instead of a Python loop.
 """
 
 from typing import Any
 
+import numpy as np
+
 from prism.statechart.states import AgentState
 
+# Position of each AgentState in a packed state column
+_STATE_INDEX: dict[AgentState, int] = {
+    state: index for index, state in enumerate(AgentState)
+}
+
+
+def pack_states(agents: list[Any]) -> np.ndarray:
+    """Pack agent states into an int8 column for vectorized queries.
+
+    Args:
+        agents: List of agent objects with a 'state' attribute
+
+    Returns:
+        Array with one AgentState index per agent, in agent order
+    """
+    return np.fromiter(
+        (_STATE_INDEX[agent.state] for agent in agents),
+        dtype=np.int8,
+        count=len(agents),
+    )
+
 
-def agents_in_state(state: AgentState, agents: list[Any]) -> int:
+def agents_in_state(
+    state: AgentState,
+    agents: list[Any],
+    state_column: np.ndarray | None = None,
+) -> int:
     """Count agents that are in the specified state.
 
     Args:
         state: The AgentState to count
         agents: List of agent objects with a 'state' attribute
+        state_column: Optional packed states from pack_states(agents); when
+            given, it is counted instead of iterating over agents
 
     Returns:
         Integer count of agents in the specified state
     """
-    return sum(1 for agent in agents if agent.state == state)
+    if state_column is not None:
+        return int(np.count_nonzero(state_column == _STATE_INDEX[state]))
+    return sum(1 for agent in agents if agent.state is state)
 
 
-def state_distribution(agents: list[Any]) -> dict[AgentState, int]:
+def state_distribution(
+    agents: list[Any],
+    state_column: np.ndarray | None = None,
+) -> dict[AgentState, int]:
     """Get distribution of agents across all states.
 
     Returns a dictionary mapping each AgentState to the count of agents
@@ -31,10 +69,16 @@ def state_distribution(agents: list[Any]) -> dict[AgentState, int]:
 
     Args:
         agents: List of agent objects with a 'state' attribute
+        state_column: Optional packed states from pack_states(agents); when
+            given, it is counted instead of iterating over agents
 
     Returns:
         Dictionary mapping AgentState to integer count
     """
+    if state_column is not None:
+        counts = np.bincount(state_column, minlength=len(_STATE_INDEX))
+        return {state: int(counts[index]) for state, index in _STATE_INDEX.items()}
+
     # Initialize all states with 0 count
     distribution: dict[AgentState, int] = {state: 0 for state in AgentState}
 
@@ -4,19 +4,32 @@ This module provides the StatechartReasoner class that uses LLM inference
 to resolve ambiguous state transitions when multiple target states are valid.
 """
 
+import asyncio
 import json
 import logging
+from functools import lru_cache
+from hashlib import blake2b
 from typing import TYPE_CHECKING, Any
 
 from agent_framework.ollama import OllamaChatClient
 
 from prism.statechart.states import AgentState
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup; stdlib json is the fallback
+    _json_loads = json.loads
+
 if TYPE_CHECKING:
     from prism.agents.social_agent import SocialAgent
 
 logger = logging.getLogger(__name__)
 
+# Reverse lookup from state value to AgentState for response parsing
+_VALUE_TO_STATE: dict[str, AgentState] = {state.value: state for state in AgentState}
+
 # State descriptions used in prompt to help LLM understand options
 STATE_DESCRIPTIONS: dict[AgentState, str] = {
     AgentState.IDLE: "Stop browsing, wait for next round",
@@ -30,6 +43,22 @@ STATE_DESCRIPTIONS: dict[AgentState, str] = {
 }
 
 
+@lru_cache(maxsize=64)
+def _options_text(options: tuple[AgentState, ...]) -> str:
+    """Render the option list for a prompt, cached per option set.
+
+    Args:
+        options: Valid target states, in prompt order
+
+    Returns:
+        One "- value: description" line per option
+    """
+    return "\n".join(
+        f"- {opt.value}: {STATE_DESCRIPTIONS.get(opt, 'Unknown state')}"
+        for opt in options
+    )
+
+
 def _format_context(context: Any) -> str:
     """Format context for inclusion in prompt.
 
@@ -52,6 +81,41 @@ def _format_context(context: Any) -> str:
     return f"Context: {context}"
 
 
+def _coalesce_key(
+    agent_interests: list[str],
+    agent_personality: str,
+    current_state: AgentState,
+    trigger: str,
+    options: list[AgentState],
+    context: Any,
+) -> bytes:
+    """Hash the inputs that decide a reasoner outcome.
+
+    The agent's name is left out, so agents with the same profile facing the
+    same situation share a decision.
+
+    Args:
+        agent_interests: List of agent's interests
+        agent_personality: Agent's personality description
+        current_state: Agent's current state
+        trigger: Event that triggered the decision
+        options: Valid target states to choose from
+        context: Additional context (e.g., Post being evaluated)
+
+    Returns:
+        Short digest identifying the decision
+    """
+    parts = (
+        "\x1f".join(agent_interests),
+        agent_personality,
+        current_state.value,
+        trigger,
+        "\x1f".join(opt.value for opt in options),
+        _format_context(context),
+    )
+    return blake2b("\x1e".join(parts).encode(), digest_size=8).digest()
+
+
 def build_reasoner_prompt(
     agent_name: str,
     agent_interests: list[str],
@@ -75,10 +139,7 @@ def build_reasoner_prompt(
     Returns:
         Formatted prompt string for LLM
     """
-    options_text = "\n".join(
-        f"- {opt.value}: {STATE_DESCRIPTIONS.get(opt, 'Unknown state')}"
-        for opt in options
-    )
+    options_text = _options_text(tuple(options))
 
     context_text = _format_context(context)
 
@@ -108,13 +169,25 @@ class StatechartReasoner:
     agent profile, context, and behavioral history.
     """
 
-    def __init__(self, client: OllamaChatClient) -> None:
+    def __init__(self, client: OllamaChatClient, coalesce: bool = False) -> None:
         """Initialize Reasoner with LLM client.
 
         Args:
             client: Ollama client for inference
+            coalesce: Whether agents with the same interests and personality,
+                facing the same state, trigger, options and context, share a
+                single LLM call. The cache grows until clear_round_cache() is
+                called, so only enable this when something clears it at each
+                round boundary (RoundController.run_round does).
         """
         self._client = client
+        self._coalesce = coalesce
+        # A None result means the owning call was cancelled before deciding
+        self._round_cache: dict[bytes, asyncio.Future[AgentState | None]] = {}
+
+    def clear_round_cache(self) -> None:
+        """Forget coalesced decisions from the previous round."""
+        self._round_cache.clear()
 
     async def decide(
         self,
@@ -126,6 +199,12 @@ class StatechartReasoner:
     ) -> AgentState:
         """Reason about which state transition to take.
 
+        When coalescing is enabled, a request matching one already seen this
+        round (same profile apart from the agent's name, same situation)
+        reuses that decision instead of calling the LLM again.
+        If the call that owns a shared prompt is cancelled, the requests
+        waiting on it make the call themselves.
+
         Args:
             agent: Agent making the decision
             current_state: Agent's current state
@@ -156,14 +235,88 @@ class StatechartReasoner:
             context=context,
         )
 
-        # Call LLM
+        if not self._coalesce:
+            return await self._run_prompt(prompt, options)
+
+        # The key covers the options, so the shared result is always valid
+        key = _coalesce_key(
+            agent.interests, agent.personality, current_state, trigger, options, context
+        )
+        pending = self._round_cache.get(key)
+        if pending is not None:
+            # Shielded so a cancelled waiter can't cancel the shared future
+            result = await asyncio.shield(pending)
+            if result is not None:
+                return result
+            # The owning call was cancelled; decide as if it never started
+            return await self.decide(agent, current_state, trigger, options, context)
+
+        future: asyncio.Future[AgentState | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._round_cache[key] = future
+        try:
+            result = await self._run_prompt(prompt, options)
+        except BaseException:
+            # Only the owner was cancelled: release waiters to retry on their own
+            self._round_cache.pop(key, None)
+            future.set_result(None)
+            raise
+        future.set_result(result)
+        return result
+
+    async def _run_prompt(self, prompt: str, options: list[AgentState]) -> AgentState:
+        """Call the LLM with a prompt and parse the chosen state.
+
+        Args:
+            prompt: Fully rendered reasoner prompt
+            options: Valid options to validate against
+
+        Returns:
+            Parsed AgentState from options, or first option as fallback
+        """
         try:
             response = await self._client.run(prompt)
             return self._parse_response(response, options)
         except Exception as e:
-            logger.warning(f"Reasoner LLM call failed: {e}, using fallback")
+            logger.warning("Reasoner LLM call failed: %s, using fallback", e)
             return options[0]
 
+    async def decide_batch(
+        self,
+        requests: list[tuple["SocialAgent", AgentState, str, list[AgentState], Any]],
+        concurrency: int = 16,
+    ) -> list[AgentState]:
+        """Reason about several transitions concurrently.
+
+        Issues the decide() calls together against the shared client, with at
+        most ``concurrency`` LLM calls in flight at once. Each request keeps
+        decide()'s per-call fallback, so one bad response does not affect the
+        others.
+
+        Args:
+            requests: (agent, current_state, trigger, options, context) tuples
+            concurrency: Maximum number of concurrent LLM calls
+
+        Returns:
+            Chosen target states, in the same order as requests
+
+        Raises:
+            ValueError: If concurrency < 1, or if any request has empty options
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def decide_one(
+            request: tuple["SocialAgent", AgentState, str, list[AgentState], Any],
+        ) -> AgentState:
+            async with semaphore:
+                return await self.decide(*request)
+
+        return list(await asyncio.gather(*(decide_one(r) for r in requests)))
+
     def _parse_response(
         self,
         response_text: str,
@@ -179,20 +332,21 @@ class StatechartReasoner:
             Parsed AgentState from options, or first option as fallback
         """
         try:
-            data = json.loads(response_text)
+            data = _json_loads(response_text)
             state_value = data.get("next_state", "").lower()
 
-            for opt in options:
-                if opt.value == state_value:
-                    return opt
+            state = _VALUE_TO_STATE.get(state_value)
+            if state is not None and state in options:
+                return state
 
             # State not in options - fallback
             logger.warning(
-                f"Reasoner returned state '{state_value}' not in options, "
-                f"using fallback: {options[0].value}"
+                "Reasoner returned state '%s' not in options, using fallback: %s",
+                state_value,
+                options[0].value,
             )
             return options[0]
 
         except (json.JSONDecodeError, KeyError, AttributeError) as e:
-            logger.warning(f"Failed to parse Reasoner response: {e}, using fallback")
+            logger.warning("Failed to parse Reasoner response: %s, using fallback", e)
             return options[0]
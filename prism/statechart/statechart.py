@@ -4,11 +4,16 @@ This module provides the core Statechart class that manages state transitions
 for agents based on triggers and guards.
 """
 
-from typing import Any
+import sys
+from dataclasses import replace
+from typing import Any, Callable
 
 from prism.statechart.states import AgentState
 from prism.statechart.transitions import Transition
 
+# Signature shared by Statechart.fire and the function built by compile()
+FireFunction = Callable[[str, AgentState, Any, dict | None], AgentState | None]
+
 
 class Statechart:
     """A statechart engine that manages state transitions.
@@ -18,7 +23,8 @@ class Statechart:
 
     Attributes:
         states: Set of valid states for this statechart
-        transitions: List of transitions defining state changes
+        transitions: Tuple of transitions defining state changes (trigger
+                     names are interned so comparisons are pointer checks)
         initial: The initial state for new instances
     """
 
@@ -51,9 +57,32 @@ class Statechart:
                 raise ValueError(f"transition target {transition.target} not in states")
 
         self.states = states
-        self.transitions = transitions
+        self.transitions: tuple[Transition, ...] = tuple(
+            replace(t, trigger=sys.intern(t.trigger)) for t in transitions
+        )
         self.initial = initial
 
+        # The statechart is immutable after construction, so precompute the
+        # introspection results once instead of rescanning on every query.
+        valid_triggers: dict[AgentState, list[str]] = {}
+        valid_targets: dict[tuple[AgentState, str], list[AgentState]] = {}
+        for transition in self.transitions:
+            triggers = valid_triggers.setdefault(transition.source, [])
+            if transition.trigger not in triggers:
+                triggers.append(transition.trigger)
+            valid_targets.setdefault(
+                (transition.source, transition.trigger), []
+            ).append(transition.target)
+
+        self._valid_triggers: dict[AgentState, tuple[str, ...]] = {
+            state: tuple(triggers) for state, triggers in valid_triggers.items()
+        }
+        self._valid_targets: dict[tuple[AgentState, str], tuple[AgentState, ...]] = {
+            key: tuple(targets) for key, targets in valid_targets.items()
+        }
+
+        self._compiled_fire: FireFunction | None = None
+
     def fire(
         self,
         trigger: str,
@@ -76,11 +105,15 @@ class Statechart:
         Returns:
             The target state if a transition fires, None otherwise
         """
+        if self._compiled_fire is not None:
+            return self._compiled_fire(trigger, current_state, agent, context)
+
         for transition in self.transitions:
-            # Check if trigger and source match
+            # Check if trigger and source match (AgentState members are
+            # singletons, so the source check is an identity comparison)
             if transition.trigger != trigger:
                 continue
-            if transition.source != current_state:
+            if transition.source is not current_state:
                 continue
 
             # Evaluate guard if present (fail-safe: exceptions treated as False)
@@ -109,6 +142,70 @@ class Statechart:
         # No matching transition found
         return None
 
+    def compile(self) -> FireFunction:
+        """Generate a fire function specialized to this statechart.
+
+        Emits straight-line Python that branches on trigger, then source
+        state, then evaluates that pair's transitions in definition order
+        with the same guard and action fail-safes as fire(). The result is
+        cached, and fire() delegates to it from then on.
+
+        Returns:
+            A callable with the signature (trigger, current_state, agent,
+            context) -> AgentState | None
+        """
+        if self._compiled_fire is not None:
+            return self._compiled_fire
+
+        # Group transitions by trigger, then source, preserving definition
+        # order; only one (trigger, source) group can ever match a call.
+        groups: dict[str, dict[AgentState, list[int]]] = {}
+        for index, transition in enumerate(self.transitions):
+            groups.setdefault(transition.trigger, {}).setdefault(
+                transition.source, []
+            ).append(index)
+
+        namespace: dict[str, Any] = {}
+        lines = ["def fire(trigger, current_state, agent, context):"]
+        for trigger_index, (trigger, by_source) in enumerate(groups.items()):
+            namespace[f"_t{trigger_index}"] = trigger
+            lines.append(f"    if trigger == _t{trigger_index}:")
+            for source, indices in by_source.items():
+                namespace[f"_s_{source.name}"] = source
+                lines.append(f"        if current_state is _s_{source.name}:")
+                for index in indices:
+                    transition = self.transitions[index]
+                    namespace[f"_x{index}"] = transition.target
+                    body = "            "
+                    if transition.guard is not None:
+                        namespace[f"_g{index}"] = transition.guard
+                        lines += [
+                            f"{body}try:",
+                            f"{body}    _ok = bool(_g{index}(agent, context))",
+                            f"{body}except Exception:",
+                            f"{body}    _ok = False",
+                            f"{body}if _ok:",
+                        ]
+                        body += "    "
+                    if transition.action is not None:
+                        namespace[f"_a{index}"] = transition.action
+                        lines += [
+                            f"{body}try:",
+                            f"{body}    _a{index}(agent, context)",
+                            f"{body}except Exception:",
+                            f"{body}    pass",
+                        ]
+                    lines.append(f"{body}return _x{index}")
+                    if transition.guard is None:
+                        # Unguarded transition always fires; the rest are dead
+                        break
+        lines.append("    return None")
+
+        code = compile("\n".join(lines), "<statechart>", "exec")
+        exec(code, namespace)
+        self._compiled_fire = namespace["fire"]
+        return self._compiled_fire
+
     def valid_triggers(self, state: AgentState) -> list[str]:
         """Get list of triggers available from a given state.
 
@@ -122,15 +219,7 @@ class Statechart:
         Returns:
             List of unique trigger names available from this state
         """
-        seen: set[str] = set()
-        triggers: list[str] = []
-
-        for transition in self.transitions:
-            if transition.source == state and transition.trigger not in seen:
-                seen.add(transition.trigger)
-                triggers.append(transition.trigger)
-
-        return triggers
+        return list(self._valid_triggers.get(state, ()))
 
     def valid_targets(self, state: AgentState, trigger: str) -> list[AgentState]:
         """Get list of possible target states for a trigger from a given state.
@@ -146,10 +235,4 @@ class Statechart:
             List of possible target states (may contain duplicates if multiple
             transitions have the same target)
         """
-        targets: list[AgentState] = []
-
-        for transition in self.transitions:
-            if transition.source == state and transition.trigger == trigger:
-                targets.append(transition.target)
-
-        return targets
+        return list(self._valid_targets.get((state, trigger), ()))
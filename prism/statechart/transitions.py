@@ -12,7 +12,7 @@ from typing import Any, Callable
 from prism.statechart.states import AgentState
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Transition:
     """Defines a state transition with optional guard and action.
 
@@ -33,7 +33,7 @@ class Transition:
     action: Callable[[Any, dict | None], None] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StateTransition:
     """Records a historical state transition for debugging and analysis.
 
@@ -10,6 +10,7 @@ Usage:
     python run_tests_opencode.py specs/tests/auth.md           # Target from frontmatter
     python run_tests_opencode.py specs/tests/                  # All .md files in directory
     python run_tests_opencode.py spec.md --target file.py      # Override frontmatter target
+    python run_tests_opencode.py specs/tests/ --jobs 8         # Judge 8 tests concurrently
 
 Spec files must declare target(s) in YAML frontmatter:
     ---
@@ -27,18 +28,64 @@ Requirements:
 """
 
 import argparse
+import functools
+import hashlib
 import json
+import os
 import re
+import shutil
+import socket
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
+
+try:
+    # orjson parses LLM responses and event lines several times faster, and
+    # its JSONDecodeError subclasses json.JSONDecodeError, so the existing
+    # except clauses still apply
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 # Prompt template file location (sibling to this script)
 JUDGE_PROMPT_FILE = Path(__file__).parent / "judge_prompt.md"
 OPENCODE_FORMAT = "json"
 RUN_TIMEOUT = 180
+SERVER_HOST = "127.0.0.1"
+SERVER_START_TIMEOUT = 30
+DEFAULT_JOBS = 4
+DEFAULT_CACHE_DIR = Path(".prism-judge-cache")
+
+# Cheap prefilter for event lines that may be "text" or "error" events
+_EVENT_TYPE_RE = re.compile(rb'"type"\s*:\s*"(?:text|error)"')
+
+# ANSI colors
+GREEN = "\033[92m"
+RED = "\033[91m"
+YELLOW = "\033[93m"
+CYAN = "\033[96m"
+RESET = "\033[0m"
+BOLD = "\033[1m"
+
+# {{name}} placeholders in the judge prompt template
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+@functools.lru_cache(maxsize=None)
+def _read_text_cached(path_str: str, mtime: float) -> str:
+    """Read a file once per (path, mtime) so spec files sharing it hit the cache."""
+    return Path(path_str).read_text()
+
+
+def _read_text(path: Path) -> str:
+    """Read a file through the (path, mtime) cache."""
+    return _read_text_cached(str(path), path.stat().st_mtime)
 
 
 # ============================================================================
@@ -57,7 +104,7 @@ class JSONExtractionError(Exception):
 
 def _extract_json_pure(text: str) -> dict:
     """Strategy 1: Assume response is pure JSON."""
-    return json.loads(text.strip())
+    return _json_loads(text.strip())
 
 
 def _extract_json_from_code_block(text: str) -> dict:
@@ -69,7 +116,12 @@ def _extract_json_from_code_block(text: str) -> dict:
     if not match:
         raise ValueError("Code block markers present but pattern didn't match")
 
-    return json.loads(match.group(1).strip())
+    return _json_loads(match.group(1).strip())
+
+
+# Tokens that matter to brace matching: an escape pair, a quote, or a brace.
+# finditer skips everything else in C instead of stepping per character.
+_BRACE_SCANNER = re.compile(r'\\.|["{}]', re.DOTALL)
 
 
 def _extract_json_balanced_braces(text: str) -> dict:
@@ -85,52 +137,50 @@ def _extract_json_balanced_braces(text: str) -> dict:
 
     depth = 0
     in_string = False
-    escape_next = False
 
-    for i in range(start, len(text)):
-        char = text[i]
-
-        # Handle escape sequences
-        if escape_next:
-            escape_next = False
-            continue
-        if char == "\\":
-            escape_next = True
-            continue
+    for match in _BRACE_SCANNER.finditer(text, start):
+        token = match.group()
 
         # Track string boundaries (braces inside strings don't count)
-        if char == '"':
+        if token == '"':
             in_string = not in_string
             continue
 
+        # Escape pairs are consumed whole, so an escaped quote never toggles
+        if in_string or len(token) > 1:
+            continue
+
         # Count braces only outside strings
-        if not in_string:
-            if char == "{":
-                depth += 1
-            elif char == "}":
-                depth -= 1
-                if depth == 0:
-                    # Found matching closing brace
-                    json_text = text[start : i + 1]
-                    return json.loads(json_text)
+        if token == "{":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                # Found matching closing brace
+                json_text = text[start : match.end()]
+                return _json_loads(json_text)
 
     raise ValueError(f"No matching closing brace found (depth={depth})")
 
 
+# Common LLM response prefixes stripped by the lenient strategy
+_LENIENT_PREFIXES = (
+    "Here's the JSON:",
+    "Here is the JSON:",
+    "Response:",
+    "Output:",
+)
+
+# Any leading run of the prefixes above (and the whitespace after them)
+_LENIENT_PREFIX_RE = re.compile(
+    r"\A(?:(?:%s)\s*)+" % "|".join(map(re.escape, _LENIENT_PREFIXES))
+)
+
+
 def _extract_json_lenient(text: str) -> dict:
     """Strategy 4: Try with aggressive whitespace/prefix removal."""
-    cleaned = text.strip()
-
     # Remove common LLM response prefixes
-    prefixes = [
-        "Here's the JSON:",
-        "Here is the JSON:",
-        "Response:",
-        "Output:",
-    ]
-    for prefix in prefixes:
-        if cleaned.startswith(prefix):
-            cleaned = cleaned[len(prefix) :].strip()
+    cleaned = _LENIENT_PREFIX_RE.sub("", text.strip(), count=1)
 
     return _extract_json_balanced_braces(cleaned)
 
@@ -139,11 +189,12 @@ def extract_judge_response_json(response_text: str) -> dict:
     """
     Extract and parse JSON from LLM response using multiple strategies.
 
-    Tries strategies in order:
-    1. Pure JSON (no wrapping)
-    2. Markdown code block
+    Tries strategies in order, skipping any that cannot succeed for this
+    response:
+    1. Pure JSON (no wrapping) - only if the response starts with '{'
+    2. Markdown code block - only if the response contains a fence
     3. Balanced brace extraction (handles nested objects)
-    4. Lenient (with prefix removal)
+    4. Lenient (with prefix removal) - only if a known prefix is present
 
     Args:
         response_text: Raw text from LLM
@@ -154,15 +205,21 @@ def extract_judge_response_json(response_text: str) -> dict:
     Raises:
         JSONExtractionError: If JSON cannot be extracted/parsed or schema is invalid
     """
-    if not response_text or not response_text.strip():
+    stripped = response_text.strip() if response_text else ""
+    if not stripped:
         raise JSONExtractionError("Empty response from LLM")
 
-    strategies = [
-        ("pure JSON", _extract_json_pure),
-        ("code block", _extract_json_from_code_block),
-        ("balanced braces", _extract_json_balanced_braces),
-        ("lenient", _extract_json_lenient),
-    ]
+    # Sniff the response so guaranteed failures never build a
+    # JSONDecodeError: pure JSON needs a leading '{', a code block needs a
+    # fence, and lenient only differs from balanced braces after a prefix.
+    strategies = []
+    if stripped[0] == "{":
+        strategies.append(("pure JSON", _extract_json_pure))
+    if "```" in stripped:
+        strategies.append(("code block", _extract_json_from_code_block))
+    strategies.append(("balanced braces", _extract_json_balanced_braces))
+    if _LENIENT_PREFIX_RE.match(stripped):
+        strategies.append(("lenient", _extract_json_lenient))
 
     errors = []
     for strategy_name, strategy_func in strategies:
@@ -202,6 +259,15 @@ def extract_judge_response_json(response_text: str) -> dict:
     )
 
 
+# Frontmatter block: opening --- through the first closing --- line
+_FRONTMATTER_RE = re.compile(r"\A---(.*?)\n---\s*(?:\n|$)", re.DOTALL)
+
+# One frontmatter line: an array item ("- value") or an unindented "key: value"
+_FRONTMATTER_LINE_RE = re.compile(
+    r"^(?:[^\S\n]*- (.*\S)[^\S\n]*|(?![ \t])([^:\n]*):(.*))$", re.MULTILINE
+)
+
+
 def parse_frontmatter(content: str) -> tuple[dict, str]:
     """
     Parse YAML frontmatter from markdown content.
@@ -209,36 +275,30 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
     Returns (metadata dict, content without frontmatter).
     Frontmatter must be delimited by --- at start and end.
     """
-    if not content.startswith("---"):
-        return {}, content
-
-    # Find the closing ---
-    end_match = re.search(r"\n---\s*(?:\n|$)", content[3:])
-    if not end_match:
+    match = _FRONTMATTER_RE.match(content)
+    if not match:
         return {}, content
 
-    frontmatter_text = content[3 : end_match.start() + 3]
-    remaining_content = content[end_match.end() + 3 :]
+    remaining_content = content[match.end() :]
 
     # Simple YAML parsing for target field (avoid yaml dependency)
     metadata = {}
-    lines = frontmatter_text.strip().split("\n")
     current_key = None
     current_list = []
 
-    for line in lines:
+    for line_match in _FRONTMATTER_LINE_RE.finditer(match.group(1).strip()):
+        item, key, value = line_match.groups()
         # Array item
-        if line.strip().startswith("- "):
+        if item is not None:
             if current_key:
-                current_list.append(line.strip()[2:].strip())
+                current_list.append(item.strip())
         # Key-value pair
-        elif ":" in line and not line.startswith(" ") and not line.startswith("\t"):
+        else:
             # Save previous list if any
             if current_key and current_list:
                 metadata[current_key] = current_list
                 current_list = []
 
-            key, _, value = line.partition(":")
             current_key = key.strip()
             value = value.strip()
             if value:
@@ -298,7 +358,7 @@ def get_targets_from_frontmatter(spec_path: Path) -> list[Path]:
     return target_paths
 
 
-@dataclass
+@dataclass(slots=True)
 class TestCase:
     """A single test case extracted from the spec file."""
 
@@ -311,7 +371,7 @@ class TestCase:
     missing_assertion: bool = False  # True if test has no code block
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Result of evaluating a test case."""
 
@@ -321,6 +381,27 @@ class TestResult:
     error: Optional[str] = None
 
 
+class _Peekable:
+    """Line iterator with one line of lookahead and a 1-based line counter."""
+
+    def __init__(self, lines):
+        self._lines = iter(lines)
+        self._next = next(self._lines, None)
+        self.line_number = 0  # Number of the last line returned by next_line()
+
+    def peek(self) -> Optional[str]:
+        """Return the next line without consuming it (None at end)."""
+        return self._next
+
+    def next_line(self) -> Optional[str]:
+        """Consume and return the next line (None at end)."""
+        line = self._next
+        if line is not None:
+            self._next = next(self._lines, None)
+            self.line_number += 1
+        return line
+
+
 class SpecParser:
     """Parses markdown spec files into test cases."""
 
@@ -328,54 +409,56 @@ class SpecParser:
         # Strip frontmatter if present
         _, content_without_frontmatter = parse_frontmatter(content)
         self.content = content_without_frontmatter
-        self.lines = self.content.split("\n")
 
     def parse(self) -> list[TestCase]:
-        """Extract all test cases from the spec file."""
+        """Extract all test cases from the spec file in a single pass."""
         tests = []
         current_section = ""
-        i = 0
+        lines = _Peekable(self.content.split("\n"))
 
-        while i < len(self.lines):
-            line = self.lines[i]
+        # Every sentinel is told apart by its first 3-4 characters, so each
+        # line is sliced once and the head compared by equality, which is
+        # cheaper than repeated startswith() calls for short literals
+        while (line := lines.next_line()) is not None:
+            head = line[:4]
 
             # Track H2 sections
-            if line.startswith("## "):
+            if head[:3] == "## ":
                 current_section = line[3:].strip()
-                i += 1
                 continue
 
             # Found H3 test case
-            if line.startswith("### "):
+            if head == "### ":
                 test_name = line[4:].strip()
-                test_line = i + 1
-                i += 1
+                test_line = lines.line_number
 
                 # Collect intent statement until we hit a code block
                 intent_lines = []
                 missing_assertion = False
-                while i < len(self.lines):
-                    if self.lines[i].startswith("```"):
+                while (line := lines.peek()) is not None:
+                    head = line[:4]
+                    if head == "### ":
+                        missing_assertion = True
                         break
-                    if self.lines[i].startswith("## ") or self.lines[i].startswith(
-                        "### "
-                    ):
+                    head = head[:3]
+                    if head == "```":
+                        break
+                    if head == "## ":
                         missing_assertion = True
                         break
-                    if self.lines[i].strip():  # Skip empty lines for intent
-                        intent_lines.append(self.lines[i])
-                    i += 1
+                    if line.strip():  # Skip empty lines for intent
+                        intent_lines.append(line)
+                    lines.next_line()
 
                 intent = "\n".join(intent_lines).strip()
 
                 # Collect the code block (assertion)
                 assertion_lines = []
-                if i < len(self.lines) and self.lines[i].startswith("```"):
-                    i += 1  # Skip opening ```
-                    while i < len(self.lines) and not self.lines[i].startswith("```"):
-                        assertion_lines.append(self.lines[i])
-                        i += 1
-                    i += 1  # Skip closing ```
+                if line is not None and line[:3] == "```":
+                    lines.next_line()  # Skip opening ```
+                    # The closing ``` is consumed by the loop condition
+                    while (line := lines.next_line()) is not None and line[:3] != "```":
+                        assertion_lines.append(line)
                 else:
                     missing_assertion = True
 
@@ -395,19 +478,112 @@ class SpecParser:
                             missing_assertion=missing_assertion,
                         )
                     )
-                continue
-
-            i += 1
 
         return tests
 
 
+def incomplete_test_result(test: TestCase) -> Optional[TestResult]:
+    """
+    Fail a test that is missing its intent or assertion, without the LLM.
+
+    Returns None for a complete test, which still needs judging.
+    """
+    if test.missing_assertion:
+        return TestResult(
+            test=test,
+            passed=False,
+            reasoning="[missing-assertion] Test has no assertion code block. Add a "
+            "fenced code block after the intent.",
+        )
+    if test.missing_intent:
+        return TestResult(
+            test=test,
+            passed=False,
+            reasoning="[missing-intent] Test has no intent statement. Each test requires "
+            "intent explaining WHY it matters. Add statement between the H3 header "
+            "and the code block.",
+        )
+    return None
+
+
 class LLMJudge:
-    """Uses opencode CLI to evaluate test cases against a target."""
+    """
+    Uses opencode CLI to evaluate test cases against a target.
 
-    def __init__(self, model: str = "github-copilot/claude-sonnet-4.5"):
+    Used as a context manager, the judge starts one `opencode serve` and each
+    evaluation attaches to it with `opencode run --attach`, so provider auth
+    and connections are set up once per session instead of once per test.
+    Outside a `with` block (or if the server fails to start) every
+    evaluation spawns a standalone `opencode run`.
+    """
+
+    def __init__(
+        self,
+        model: str = "github-copilot/claude-sonnet-4.5",
+        use_server: bool = True,
+        cache_dir: Optional[Path] = None,
+    ):
         self.model = model
+        # Resolving the CLI to an absolute path (together with close_fds=False)
+        # lets subprocess launch it via posix_spawn instead of fork+exec
+        self._executable = shutil.which("opencode") or "opencode"
+        self.use_server = use_server
+        self.cache_dir = cache_dir
         self._prompt_template = self._load_prompt_template()
+        self._server: Optional[subprocess.Popen] = None
+        self._server_url: Optional[str] = None
+
+    def __enter__(self) -> "LLMJudge":
+        if self.use_server:
+            self._start_server()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop_server()
+
+    def _start_server(self) -> None:
+        """Start a shared `opencode serve`; fall back to per-test spawns on failure."""
+        with socket.socket() as sock:
+            sock.bind((SERVER_HOST, 0))
+            port = sock.getsockname()[1]
+
+        server = subprocess.Popen(
+            [self._executable, "serve", "--hostname", SERVER_HOST, "--port", str(port)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
+        )
+        deadline = time.monotonic() + SERVER_START_TIMEOUT
+        while time.monotonic() < deadline and server.poll() is None:
+            try:
+                with socket.create_connection((SERVER_HOST, port), timeout=1):
+                    self._server = server
+                    self._server_url = f"http://{SERVER_HOST}:{port}"
+                    return
+            except OSError:
+                time.sleep(0.2)
+
+        if server.poll() is None:
+            server.kill()
+        server.wait()
+        print(
+            f"{YELLOW}Warning: opencode serve did not start; "
+            f"running a separate opencode process per test{RESET}"
+        )
+
+    def _stop_server(self) -> None:
+        """Shut down the shared server, if one is running."""
+        if self._server is None:
+            return
+        self._server.terminate()
+        try:
+            self._server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._server.kill()
+            self._server.wait()
+        self._server = None
+        self._server_url = None
 
     def _load_prompt_template(self) -> str:
         """Load the judge prompt template from the external markdown file."""
@@ -416,30 +592,89 @@ class LLMJudge:
                 f"Judge prompt file not found: {JUDGE_PROMPT_FILE}\n"
                 f"This file must be present alongside run_tests_opencode.py"
             )
-        return JUDGE_PROMPT_FILE.read_text()
+        return _read_text(JUDGE_PROMPT_FILE)
+
+    def _cache_path(self, prompt: str) -> Optional[Path]:
+        """Result cache file for this model and rendered prompt, if caching is on."""
+        if self.cache_dir is None:
+            return None
+        # The rendered prompt covers the template, the test and the target content
+        key = hashlib.blake2b(f"{self.model}\n{prompt}".encode(), digest_size=16)
+        return self.cache_dir / f"{key.hexdigest()}.json"
+
+    def _load_cached(self, cache_path: Optional[Path]) -> Optional[dict]:
+        """Return a cached PASS judgment, or None on a miss or unusable entry."""
+        if cache_path is None:
+            return None
+        try:
+            data = _json_loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        # Only passes are stored; ignore FAIL entries left by older runs
+        if (
+            isinstance(data, dict)
+            and data.get("passed") is True
+            and isinstance(data.get("reasoning"), str)
+        ):
+            return data
+        return None
+
+    def _store_cached(self, cache_path: Optional[Path], parsed: dict) -> None:
+        """
+        Persist a PASS judgment atomically; cache write failures are not fatal.
+
+        FAIL verdicts are never stored, so a flaky or wrong failure is judged
+        afresh on the next run instead of sticking until the cache is cleared.
+        """
+        if cache_path is None or not parsed["passed"]:
+            return
+        entry = {"passed": parsed["passed"], "reasoning": parsed["reasoning"]}
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=cache_path.parent, suffix=".tmp", delete=False
+            ) as tmp:
+                json.dump(entry, tmp)
+            os.replace(tmp.name, cache_path)
+        except OSError:
+            pass
 
     def _render_prompt(
         self, test: TestCase, target_content: str, target_name: str
     ) -> str:
-        """Substitute placeholders in the prompt template."""
-        return (
-            self._prompt_template.replace("{{target_name}}", target_name)
-            .replace("{{target_content}}", target_content)
-            .replace("{{test_name}}", test.name)
-            .replace("{{test_section}}", test.section)
-            .replace("{{intent}}", test.intent)
-            .replace("{{assertion_block}}", test.assertion_block)
+        """Substitute placeholders in the prompt template in a single pass."""
+        substitutions = {
+            "target_name": target_name,
+            "target_content": target_content,
+            "test_name": test.name,
+            "test_section": test.section,
+            "intent": test.intent,
+            "assertion_block": test.assertion_block,
+        }
+        # Unknown placeholders are left as-is; inserted values are not rescanned
+        return _PLACEHOLDER_RE.sub(
+            lambda m: substitutions.get(m.group(1), m.group(0)),
+            self._prompt_template,
         )
 
-    def _extract_text_from_events(self, output: str) -> tuple[str, list[str]]:
-        """Extract text from opencode JSON event stream."""
+    def _extract_text_from_events(
+        self, lines: Iterable[bytes]
+    ) -> tuple[str, list[str]]:
+        """
+        Extract text from opencode JSON event stream, one line at a time.
+
+        Lines stay as raw bytes: skipped events are never decoded, and the
+        JSON parser decodes only the string values of the events it reads.
+        """
         text_parts = []
         event_errors = []
-        for line in output.splitlines():
-            if not line.strip():
+        for line in lines:
+            # Only text and error events are read; skip parsing the rest
+            # (step and tool events, which can carry large tool output)
+            if not _EVENT_TYPE_RE.search(line):
                 continue
             try:
-                event = json.loads(line)
+                event = _json_loads(line)
             except json.JSONDecodeError:
                 continue
             event_type = event.get("type")
@@ -452,31 +687,98 @@ class LLMJudge:
                 event_errors.append(event.get("error") or str(event))
         return "".join(text_parts).strip(), event_errors
 
+    def _run_opencode(self, prompt: str) -> tuple[int, str, list[str], str]:
+        """
+        Run opencode once, parsing its output as it streams in.
+
+        Events are consumed line by line from the pipe, so the full stdout is
+        never buffered. The prompt is written from a separate thread so a
+        large prompt can't deadlock against unread stdout, and stderr goes to
+        a temporary file so it can't fill its pipe and stall the child while
+        stdout is being read.
+
+        Returns (returncode, response_text, event_errors, stderr).
+        Raises subprocess.TimeoutExpired if the run exceeds RUN_TIMEOUT.
+        """
+        cmd = [self._executable, "run", "-m", self.model, "--format", OPENCODE_FORMAT]
+        if self._server_url is not None:
+            cmd += ["--attach", self._server_url]
+        with tempfile.TemporaryFile() as stderr_file:
+            # Binary pipes: stdout is parsed as bytes, never decoded wholesale
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                # Python-created fds are non-inheritable (PEP 446), so there is
+                # nothing extra to close in the child
+                close_fds=False,
+            )
+            # signal.alarm only works on the main thread, and evaluate() runs
+            # in a worker pool, so enforce the timeout with a timer instead
+            timed_out = threading.Event()
+
+            def kill():
+                timed_out.set()
+                proc.kill()
+
+            def feed_stdin():
+                try:
+                    proc.stdin.write(prompt.encode())
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    pass  # Child exited early; its return code reports why
+
+            timer = threading.Timer(RUN_TIMEOUT, kill)
+            timer.start()
+            # Feed the prompt from its own thread: a prompt larger than the
+            # pipe buffer would otherwise block here while the child blocks
+            # writing stdout that nobody is reading yet
+            writer = threading.Thread(target=feed_stdin, daemon=True)
+            writer.start()
+            try:
+                event_errors = []
+                if OPENCODE_FORMAT == "json":
+                    response_text, event_errors = self._extract_text_from_events(
+                        proc.stdout
+                    )
+                else:
+                    response_text = proc.stdout.read().decode().strip()
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+                writer.join()
+                proc.stdout.close()
+
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(cmd, RUN_TIMEOUT)
+
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(errors="replace")
+            return returncode, response_text, event_errors, stderr
+
     def evaluate(
         self, test: TestCase, target_content: str, target_name: str
     ) -> TestResult:
-        """Evaluate a single test case against the target content."""
+        """
+        Evaluate a single test case against the target content.
 
-        # Fail immediately if intent is missing - don't even call the LLM
-        if test.missing_assertion:
-            return TestResult(
-                test=test,
-                passed=False,
-                reasoning="[missing-assertion] Test has no assertion code block. Add a "
-                "fenced code block after the intent.",
-            )
+        Expects a structurally complete test; TestRunner fails tests with a
+        missing intent or assertion via incomplete_test_result() instead.
+        """
+        prompt = self._render_prompt(test, target_content, target_name)
 
-        # Fail immediately if intent is missing - don't even call the LLM
-        if test.missing_intent:
+        # Identical model, prompt and target already passed - reuse it
+        cache_path = self._cache_path(prompt)
+        cached = self._load_cached(cache_path)
+        if cached is not None:
             return TestResult(
-                test=test,
-                passed=False,
-                reasoning="[missing-intent] Test has no intent statement. Each test requires "
-                "intent explaining WHY it matters. Add statement between the H3 header "
-                "and the code block.",
+                test=test, passed=cached["passed"], reasoning=cached["reasoning"]
             )
 
-        prompt = self._render_prompt(test, target_content, target_name)
         retry_prompt_suffix = (
             "\n\nREMINDER: Output ONLY a JSON object. No markdown, no code fences."
         )
@@ -487,38 +789,21 @@ class LLMJudge:
             last_error = ""
             for attempt in range(max_retries):
                 run_prompt = prompt if attempt == 0 else prompt + retry_prompt_suffix
-                result = subprocess.run(
-                    [
-                        "opencode",
-                        "run",
-                        "-m",
-                        self.model,
-                        "--format",
-                        OPENCODE_FORMAT,
-                    ],
-                    input=run_prompt,
-                    capture_output=True,
-                    text=True,
-                    timeout=RUN_TIMEOUT,
+                returncode, response_text, event_errors, stderr = self._run_opencode(
+                    run_prompt
                 )
 
-                if result.returncode != 0:
+                if returncode != 0:
                     return TestResult(
                         test=test,
                         passed=False,
                         reasoning="",
-                        error=f"opencode CLI failed: {result.stderr}",
+                        error=f"opencode CLI failed: {stderr}",
                     )
 
-                response_text = result.stdout.strip()
-                event_errors = []
-                if OPENCODE_FORMAT == "json":
-                    response_text, event_errors = self._extract_text_from_events(
-                        response_text
-                    )
-                    if event_errors and not response_text:
-                        last_error = f"opencode event error: {event_errors[0]}"
-                        continue
+                if event_errors and not response_text:
+                    last_error = f"opencode event error: {event_errors[0]}"
+                    continue
 
                 if not response_text:
                     last_error = "opencode returned empty response"
@@ -527,6 +812,7 @@ class LLMJudge:
                 # Extract and validate JSON from response
                 try:
                     parsed = extract_judge_response_json(response_text)
+                    self._store_cached(cache_path, parsed)
                     return TestResult(
                         test=test,
                         passed=parsed["passed"],
@@ -571,61 +857,64 @@ class LLMJudge:
 class TestRunner:
     """Runs all tests and reports results."""
 
-    # ANSI colors
-    GREEN = "\033[92m"
-    RED = "\033[91m"
-    YELLOW = "\033[93m"
-    CYAN = "\033[96m"
-    RESET = "\033[0m"
-    BOLD = "\033[1m"
-
     def __init__(
         self,
         spec_path: Path,
         target_paths: list[Path],
         model: str = "github-copilot/claude-sonnet-4.5",
         test_filter: str = None,
+        jobs: int = DEFAULT_JOBS,
+        judge: Optional[LLMJudge] = None,
     ):
         self.spec_path = spec_path
         self.target_paths = target_paths
         self.test_filter = test_filter
-        self.judge = LLMJudge(model=model)
+        self.jobs = jobs
+        self.judge = judge if judge is not None else LLMJudge(model=model)
 
     def _load_targets(self) -> tuple[str, str]:
         """Load and concatenate target file contents. Returns (content, display_name)."""
         if len(self.target_paths) == 1:
-            return self.target_paths[0].read_text(), self.target_paths[0].name
+            return _read_text(self.target_paths[0]), self.target_paths[0].name
 
         # Multiple targets - concatenate with headers
         parts = []
         names = []
         for path in self.target_paths:
-            parts.append(f"# File: {path}\n\n{path.read_text()}")
+            parts.append(f"# File: {path}\n\n{_read_text(path)}")
             names.append(path.name)
         return "\n\n---\n\n".join(parts), ", ".join(names)
 
+    @functools.cached_property
+    def targets(self) -> tuple[str, str]:
+        """
+        Target (content, display_name), loaded once per runner.
+
+        Every evaluation receives this same string by reference, so the
+        (possibly large) target is read and joined once, not once per test.
+        """
+        return self._load_targets()
+
     def run(self) -> tuple[int, int]:
         """Run all tests and return (passed, total) counts."""
 
         # Load files
         spec_content = self.spec_path.read_text()
-        target_content, target_name = self._load_targets()
+        target_content, target_name = self.targets
 
         # Parse tests
         parser = SpecParser(spec_content)
         tests = parser.parse()
 
         if not tests:
-            print(f"{self.YELLOW}No tests found in {self.spec_path}{self.RESET}")
+            print(f"{YELLOW}No tests found in {self.spec_path}{RESET}")
             return 0, 0
 
         # Filter by test name if specified
         if self.test_filter:
             tests = [t for t in tests if t.name == self.test_filter]
             if not tests:
-                print(
-                    f"{self.YELLOW}No test named '{self.test_filter}' found{self.RESET}"
-                )
+                print(f"{YELLOW}No test named '{self.test_filter}' found{RESET}")
                 return 0, 0
 
         # Format target display
@@ -634,7 +923,7 @@ class TestRunner:
         else:
             target_display = f"{len(self.target_paths)} files: {', '.join(str(p) for p in self.target_paths)}"
 
-        print(f"\n{self.BOLD}Running LLM-as-Judge Tests (opencode){self.RESET}")
+        print(f"\n{BOLD}Running LLM-as-Judge Tests (opencode){RESET}")
         print(f"Spec: {self.spec_path}")
         print(f"Target: {target_display}")
         print(f"Tests: {len(tests)}")
@@ -643,40 +932,45 @@ class TestRunner:
         passed = 0
         failed = 0
 
-        for test in tests:
-            print(
-                f"\n{self.CYAN}{test.section}{self.RESET} > {test.name} ... ",
-                end="",
-                flush=True,
-            )
-
-            result = self.judge.evaluate(test, target_content, target_name)
-
-            if result.error:
-                status = f"{self.RED}ERROR{self.RESET}"
-                failed += 1
-            elif result.passed:
-                status = f"{self.GREEN}PASS{self.RESET}"
-                passed += 1
-            else:
-                status = f"{self.RED}FAIL{self.RESET}"
-                failed += 1
-
-            print(status)
-
-            if result.error:
-                print(f"  {self.RED}{result.error}{self.RESET}")
-            elif not result.passed:
-                print(f"  {result.reasoning}")
+        def judge(test: TestCase) -> TestResult:
+            # Incomplete tests fail up front; only complete ones reach the judge
+            prefailed = incomplete_test_result(test)
+            if prefailed is not None:
+                return prefailed
+            return self.judge.evaluate(test, target_content, target_name)
+
+        # Each evaluation blocks on an independent CLI subprocess, so keep
+        # several in flight; map() yields in spec order, so reports do too
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            for result in pool.map(judge, tests):
+                test = result.test
+
+                if result.error:
+                    status = f"{RED}ERROR{RESET}"
+                    failed += 1
+                elif result.passed:
+                    status = f"{GREEN}PASS{RESET}"
+                    passed += 1
+                else:
+                    status = f"{RED}FAIL{RESET}"
+                    failed += 1
+
+                # One write (and flush) per test instead of a print per line.
+                # Only this thread reports, so completions can't interleave.
+                report = f"\n{CYAN}{test.section}{RESET} > {test.name} ... {status}\n"
+                if result.error:
+                    report += f"  {RED}{result.error}{RESET}\n"
+                elif not result.passed:
+                    report += f"  {result.reasoning}\n"
+                sys.stdout.write(report)
+                sys.stdout.flush()
 
         # Summary
         print("\n" + "=" * 60)
         if failed == 0:
-            print(f"{self.GREEN}{self.BOLD}All {passed} tests passed{self.RESET}")
+            print(f"{GREEN}{BOLD}All {passed} tests passed{RESET}")
         else:
-            print(
-                f"{self.RED}{self.BOLD}{failed} failed{self.RESET}, {self.GREEN}{passed} passed{self.RESET}"
-            )
+            print(f"{RED}{BOLD}{failed} failed{RESET}, {GREEN}{passed} passed{RESET}")
 
         return passed, len(tests)
 
@@ -699,6 +993,30 @@ def main():
         help="Model to use in provider/model format (default: github-copilot/claude-sonnet-4.5)",
     )
     parser.add_argument("--test", help="Run only the test with this name (exact match)")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Number of tests to judge concurrently (default: {DEFAULT_JOBS})",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help="Directory for cached PASS judgments, keyed by model, prompt and "
+        f"target content (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the LLM, ignoring and not writing cached judgments",
+    )
+    parser.add_argument(
+        "--no-server",
+        action="store_true",
+        help="Spawn a standalone opencode per test instead of attaching to a "
+        "shared `opencode serve`",
+    )
 
     args = parser.parse_args()
 
@@ -706,6 +1024,10 @@ def main():
         print(f"Error: Spec path not found: {args.spec_path}")
         sys.exit(1)
 
+    if args.jobs < 1:
+        print(f"Error: --jobs must be at least 1, got {args.jobs}")
+        sys.exit(1)
+
     # Check opencode CLI is available
     try:
         subprocess.run(["opencode", "--version"], capture_output=True, check=True)
@@ -722,37 +1044,48 @@ def main():
     else:
         spec_files = [args.spec_path]
 
-    # Run all spec files
+    # Run all spec files with one judge so the prompt template loads once
+    # and every test attaches to the same opencode server
     total_passed = 0
     total_tests = 0
 
-    for spec_file in spec_files:
-        # Get targets from frontmatter (or use CLI override)
-        if args.target:
-            if not args.target.exists():
-                print(f"Error: Target file not found: {args.target}")
-                sys.exit(1)
-            target_paths = [args.target]
-        else:
-            target_paths = get_targets_from_frontmatter(spec_file)
-
-        runner = TestRunner(
-            spec_file, target_paths, model=args.model, test_filter=args.test
-        )
-        passed, total = runner.run()
-        total_passed += passed
-        total_tests += total
+    with LLMJudge(
+        model=args.model,
+        use_server=not args.no_server,
+        cache_dir=None if args.no_cache else args.cache_dir,
+    ) as judge:
+        for spec_file in spec_files:
+            # Get targets from frontmatter (or use CLI override)
+            if args.target:
+                if not args.target.exists():
+                    print(f"Error: Target file not found: {args.target}")
+                    sys.exit(1)
+                target_paths = [args.target]
+            else:
+                target_paths = get_targets_from_frontmatter(spec_file)
+
+            runner = TestRunner(
+                spec_file,
+                target_paths,
+                model=args.model,
+                test_filter=args.test,
+                jobs=args.jobs,
+                judge=judge,
+            )
+            passed, total = runner.run()
+            total_passed += passed
+            total_tests += total
 
     # Final summary if multiple files
     if len(spec_files) > 1:
         print(f"\n{'=' * 60}")
         print(f"TOTAL: {len(spec_files)} spec files, {total_tests} tests")
         if total_passed == total_tests:
-            print(f"\033[92m\033[1mAll {total_passed} tests passed\033[0m")
+            print(f"{GREEN}{BOLD}All {total_passed} tests passed{RESET}")
         else:
             failed = total_tests - total_passed
             print(
-                f"\033[91m\033[1m{failed} failed\033[0m, \033[92m{total_passed} passed\033[0m"
+                f"{RED}{BOLD}{failed} failed{RESET}, {GREEN}{total_passed} passed{RESET}"
             )
 
     sys.exit(0 if total_passed == total_tests else 1)
@@ -0,0 +1,81 @@
+"""Shared fixtures for agent tests."""
+
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from agent_framework.ollama import OllamaChatClient
+
+from prism.agents.social_agent import SocialAgent
+from prism.llm.client import create_llm_client
+from prism.llm.config import PrismConfig
+
+
+@pytest.fixture(scope="session")
+def ollama_client(
+    default_prism_config: PrismConfig,
+) -> tuple[PrismConfig, OllamaChatClient]:
+    """Build one real Ollama client per session from the default config."""
+    return default_prism_config, create_llm_client(default_prism_config.llm)
+
+
+@pytest.fixture
+def make_social_agent(ollama_client) -> Callable[..., SocialAgent]:
+    """Factory for SocialAgents backed by the session's real Ollama client.
+
+    Takes the agent profile (agent_id, name, interests, personality) as
+    keyword arguments; client and sampling options come from the config.
+    """
+    config, client = ollama_client
+
+    def _make(**profile) -> SocialAgent:
+        return SocialAgent(
+            client=client,
+            temperature=config.llm.temperature,
+            max_tokens=config.llm.max_tokens,
+            **profile,
+        )
+
+    return _make
+
+
+class StubAgent:
+    """Agent stand-in whose run() returns a canned response and records calls."""
+
+    __slots__ = ("response", "calls")
+
+    def __init__(self, response: Any) -> None:
+        self.response = response
+        self.calls: list[tuple[tuple, dict]] = []
+
+    async def run(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        return self.response
+
+
+class StubChatClient:
+    """Chat client stand-in whose as_agent() hands back a fixed StubAgent."""
+
+    __slots__ = ("agent",)
+
+    def __init__(self, agent: StubAgent) -> None:
+        self.agent = agent
+
+    def as_agent(self, *args: Any, **kwargs: Any) -> StubAgent:
+        return self.agent
+
+
+@pytest.fixture
+def make_mock_client() -> Callable[..., StubChatClient]:
+    """Factory for fake chat clients whose agent.run() returns a canned response.
+
+    The response carries the given ``text`` and structured ``value``; the
+    agent is reachable as ``client.agent`` and its ``calls`` lists the
+    ``(args, kwargs)`` of each run().
+    """
+
+    def _make(text: str | None = None, value: Any = None) -> StubChatClient:
+        return StubChatClient(StubAgent(SimpleNamespace(text=text, value=value)))
+
+    return _make
@@ -60,37 +60,19 @@ class TestAgentDecisionInvalid:
                 reason="Not a valid choice.",
             )
 
-    def test_reply_without_content_raises_error(self):
-        with pytest.raises(ValidationError):
-            AgentDecision(
-                choice="REPLY",
-                reason="I want to reply.",
-                content=None,
-            )
-
-    def test_reshare_without_content_raises_error(self):
-        with pytest.raises(ValidationError):
-            AgentDecision(
-                choice="RESHARE",
-                reason="Worth resharing.",
-                content=None,
-            )
-
-    def test_reply_with_empty_content_raises_error(self):
-        with pytest.raises(ValidationError):
-            AgentDecision(
-                choice="REPLY",
-                reason="I want to reply.",
-                content="",
-            )
-
-    def test_reshare_with_empty_content_raises_error(self):
-        with pytest.raises(ValidationError):
-            AgentDecision(
-                choice="RESHARE",
-                reason="Worth resharing.",
-                content="",
-            )
+    @pytest.mark.parametrize(
+        ("choice", "reason", "content"),
+        [
+            ("REPLY", "I want to reply.", None),
+            ("RESHARE", "Worth resharing.", None),
+            ("REPLY", "I want to reply.", ""),
+            ("RESHARE", "Worth resharing.", ""),
+        ],
+        ids=["reply-none", "reshare-none", "reply-empty", "reshare-empty"],
+    )
+    def test_missing_content_raises_error(self, choice, reason, content):
+        with pytest.raises(ValidationError, match=f"content is required.*{choice}"):
+            AgentDecision(choice=choice, reason=reason, content=content)
 
     def test_empty_reason_raises_error(self):
         with pytest.raises(ValidationError):
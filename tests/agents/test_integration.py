@@ -7,40 +7,59 @@ Run with: uv run pytest -m integration
 import pytest
 
 from prism.agents.decision import AgentDecision
-from prism.agents.social_agent import SocialAgent
-from prism.llm.client import create_llm_client
-from prism.llm.config import load_config
 
-
-@pytest.mark.integration
-async def test_social_agent_makes_valid_decision_with_real_ollama():
-    """Integration test: SocialAgent produces valid AgentDecision with real LLM."""
-    # Load config from default YAML
-    config = load_config("configs/default.yaml")
-
-    # Create real OllamaChatClient
-    client = create_llm_client(config.llm)
-
-    # Create SocialAgent with test profile
-    agent = SocialAgent(
-        agent_id="test_agent_001",
-        name="Test User",
-        interests=["technology", "artificial intelligence", "startups"],
-        personality="Enthusiastic tech optimist who loves discussing new innovations",
-        client=client,
-        temperature=config.llm.temperature,
-        max_tokens=config.llm.max_tokens,
-    )
-
-    # Sample feed post
-    feed_text = """
+# The Ollama client is shared across the session (see conftest.py), so the
+# tests share one event loop too; its HTTP connections are bound to the loop.
+# Under pytest-xdist, the "ollama" group keeps them on one worker so they
+# don't contend for the single local backend.
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.requires_ollama,
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.xdist_group("ollama"),
+]
+
+
+TECH_PROFILE = {
+    "agent_id": "test_agent_001",
+    "name": "Test User",
+    "interests": ["technology", "artificial intelligence", "startups"],
+    "personality": "Enthusiastic tech optimist who loves discussing new innovations",
+}
+
+CHEF_PROFILE = {
+    "agent_id": "test_agent_002",
+    "name": "Chef Mario",
+    "interests": ["cooking", "Italian cuisine", "restaurants"],
+    "personality": "Passionate chef who only cares about food",
+}
+
+TECH_FEED = """
     Just launched our new AI-powered code review tool!
     It uses LLMs to catch bugs and suggest improvements.
     Early users report 40% fewer bugs making it to production.
     #AI #DevTools #Startups
     """
 
-    # Make a decision
+# Unrelated to the chef's interests
+SPACE_FEED = """
+    New firmware update for the Mars rover just dropped!
+    The team fixed the wheel actuator issue and improved solar panel efficiency.
+    #Space #NASA #Engineering
+    """
+
+
+@pytest.mark.parametrize(
+    ("profile", "feed_text"),
+    [(TECH_PROFILE, TECH_FEED), (CHEF_PROFILE, SPACE_FEED)],
+    ids=["relevant-content", "unrelated-content"],
+)
+async def test_social_agent_makes_valid_decision_with_real_ollama(
+    make_social_agent, profile, feed_text
+):
+    """Integration test: SocialAgent produces valid AgentDecision with real LLM."""
+    agent = make_social_agent(**profile)
+
     decision = await agent.decide(feed_text)
 
     # Verify we get a valid AgentDecision
@@ -52,35 +71,3 @@ async def test_social_agent_makes_valid_decision_with_real_ollama():
     if decision.choice in ("REPLY", "RESHARE"):
         assert decision.content is not None
         assert len(decision.content) > 0
-
-
-@pytest.mark.integration
-async def test_social_agent_handles_unrelated_content():
-    """Integration test: SocialAgent handles content outside agent's interests."""
-    config = load_config("configs/default.yaml")
-    client = create_llm_client(config.llm)
-
-    # Create agent interested in cooking
-    agent = SocialAgent(
-        agent_id="test_agent_002",
-        name="Chef Mario",
-        interests=["cooking", "Italian cuisine", "restaurants"],
-        personality="Passionate chef who only cares about food",
-        client=client,
-        temperature=config.llm.temperature,
-        max_tokens=config.llm.max_tokens,
-    )
-
-    # Post about something unrelated to cooking
-    feed_text = """
-    New firmware update for the Mars rover just dropped!
-    The team fixed the wheel actuator issue and improved solar panel efficiency.
-    #Space #NASA #Engineering
-    """
-
-    decision = await agent.decide(feed_text)
-
-    # Should still produce a valid decision
-    assert isinstance(decision, AgentDecision)
-    assert decision.choice in ("LIKE", "REPLY", "RESHARE", "SCROLL")
-    assert len(decision.reason) > 0
@@ -57,6 +57,20 @@ class TestBuildSystemPrompt:
         # Should mention JSON format for structured output
         assert "JSON" in prompt or "json" in prompt
 
+    def test_reuses_prompt_for_identical_profile(self):
+        """Identical profiles should share one rendered prompt."""
+        first = build_system_prompt(
+            name="Frank",
+            interests=["hiking", "photography"],
+            personality="adventurous",
+        )
+        second = build_system_prompt(
+            name="Frank",
+            interests=["hiking", "photography"],
+            personality="adventurous",
+        )
+        assert first is second
+
 
 class TestBuildFeedPrompt:
     """Tests for build_feed_prompt function."""
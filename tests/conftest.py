@@ -0,0 +1,40 @@
+"""Shared fixtures and pytest hooks for the whole test suite."""
+
+from functools import cache
+
+import httpx
+import pytest
+
+from prism.llm.config import PrismConfig, load_config
+
+
+@pytest.fixture(scope="session")
+def default_prism_config() -> PrismConfig:
+    """Load configs/default.yaml once per session; tests must not mutate it."""
+    return load_config("configs/default.yaml")
+
+
+@pytest.fixture(scope="session")
+def default_prism() -> PrismConfig:
+    """Build PrismConfig() from its defaults once per session; tests only read it."""
+    return PrismConfig()
+
+
+@cache
+def _ollama_reachable() -> bool:
+    """Probe the configured Ollama host once per session.
+
+    Ollama answers a plain GET on its root URL, so one short request tells
+    whether the server is up without waiting on a model call to time out.
+    """
+    host = load_config("configs/default.yaml").llm.host
+    try:
+        return httpx.get(host, timeout=0.5).is_success
+    except httpx.HTTPError:
+        return False
+
+
+def pytest_runtest_setup(item: pytest.Item) -> None:
+    """Skip tests marked requires_ollama when the Ollama server is down."""
+    if item.get_closest_marker("requires_ollama") and not _ollama_reachable():
+        pytest.skip("Ollama server not reachable")
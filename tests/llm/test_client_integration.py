@@ -9,10 +9,11 @@ import json
 import pytest
 
 from prism.llm.client import create_llm_client
-from prism.llm.config import LLMConfig, load_config
+from prism.llm.config import LLMConfig
 
 
 @pytest.mark.integration
+@pytest.mark.requires_ollama
 class TestOllamaIntegration:
     """Integration tests that require a running Ollama server."""
 
@@ -26,11 +27,9 @@ class TestOllamaIntegration:
         assert client.host == "http://localhost:11434"
         assert client.model_id == "mistral"
 
-    @pytest.mark.asyncio
-    async def test_agent_returns_response(self):
+    async def test_agent_returns_response(self, default_prism_config):
         """Verify ChatAgent can get a response from Ollama."""
-        config = load_config("configs/default.yaml")
-        client = create_llm_client(config.llm)
+        client = create_llm_client(default_prism_config.llm)
 
         # Create a simple agent using as_agent()
         agent = client.as_agent(
@@ -49,12 +48,9 @@ class TestOllamaIntegration:
         assert response.text is not None
         assert len(response.text) > 0
 
-    @pytest.mark.asyncio
-    async def test_agent_with_config_from_yaml(self):
+    async def test_agent_with_config_from_yaml(self, default_prism_config):
         """Verify full config-to-response flow works."""
-        # Load config from default YAML
-        config = load_config("configs/default.yaml")
-        client = create_llm_client(config.llm)
+        client = create_llm_client(default_prism_config.llm)
 
         agent = client.as_agent(
             name="config_test_agent",
@@ -64,8 +60,8 @@ class TestOllamaIntegration:
         response = await agent.run(
             "What color is the sky? One word.",
             options={
-                "temperature": config.llm.temperature,
-                "max_tokens": config.llm.max_tokens,
+                "temperature": default_prism_config.llm.temperature,
+                "max_tokens": default_prism_config.llm.max_tokens,
             },
         )
 
@@ -74,8 +70,7 @@ class TestOllamaIntegration:
         # Should be a short response given the constraints
         assert len(response.text.strip()) > 0
 
-    @pytest.mark.asyncio
-    async def test_json_format_with_manual_parsing(self):
+    async def test_json_format_with_manual_parsing(self, default_prism_config):
         """Verify JSON format mode works for structured output.
 
         Ollama doesn't support Pydantic response_format directly,
@@ -88,8 +83,7 @@ class TestOllamaIntegration:
             answer: str
             confidence: int
 
-        config = load_config("configs/default.yaml")
-        client = create_llm_client(config.llm)
+        client = create_llm_client(default_prism_config.llm)
 
         agent = client.as_agent(
             name="structured_agent",
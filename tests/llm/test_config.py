@@ -1,35 +1,75 @@
 """Tests for LLMConfig, PrismConfig, and load_config."""
 
+import os
+from pathlib import Path
+
 import pytest
+import yaml
 from pydantic import ValidationError
 
+from prism._yaml import SafeYamlLoader
 from prism.llm.config import LLMConfig, PrismConfig, load_config
 
 
-class TestLLMConfigDefaults:
-    def test_default_provider(self):
-        config = LLMConfig()
-        assert config.provider == "ollama"
+# The default config is only read, so it is built once per module
+@pytest.fixture(scope="module")
+def default_llm() -> LLMConfig:
+    return LLMConfig()
+
+
+# The YAML files are only read, so each is written once per module;
+# tests that edit a file use their own tmp_path
+def _write_yaml(tmp_path_factory, name: str, content: str) -> Path:
+    path = tmp_path_factory.mktemp("configs") / name
+    path.write_text(content)
+    return path
+
+
+@pytest.fixture(scope="module")
+def valid_yaml(tmp_path_factory) -> Path:
+    return _write_yaml(
+        tmp_path_factory,
+        "test_config.yaml",
+        "llm:\n"
+        "  provider: ollama\n"
+        "  host: http://localhost:11434\n"
+        "  model_id: qwen2.5\n"
+        "  temperature: 0.5\n"
+        "  max_tokens: 256\n",
+    )
+
+
+@pytest.fixture(scope="module")
+def phi3_yaml(tmp_path_factory) -> Path:
+    return _write_yaml(tmp_path_factory, "test_config.yaml", "llm:\n  model_id: phi3\n")
 
-    def test_default_host(self):
-        config = LLMConfig()
-        assert config.host == "http://localhost:11434"
 
-    def test_default_model_id(self):
-        config = LLMConfig()
-        assert config.model_id == "mistral"
+@pytest.fixture(scope="module")
+def invalid_yaml(tmp_path_factory) -> Path:
+    return _write_yaml(
+        tmp_path_factory, "bad_config.yaml", "llm:\n  temperature: 5.0\n"
+    )
 
-    def test_default_temperature(self):
-        config = LLMConfig()
-        assert config.temperature == 0.7
 
-    def test_default_max_tokens(self):
-        config = LLMConfig()
-        assert config.max_tokens == 512
+@pytest.fixture(scope="module")
+def empty_yaml(tmp_path_factory) -> Path:
+    return _write_yaml(tmp_path_factory, "empty.yaml", "")
 
-    def test_default_seed_is_none(self):
-        config = LLMConfig()
-        assert config.seed is None
+
+class TestLLMConfigDefaults:
+    @pytest.mark.parametrize(
+        ("field", "expected"),
+        [
+            ("provider", "ollama"),
+            ("host", "http://localhost:11434"),
+            ("model_id", "mistral"),
+            ("temperature", 0.7),
+            ("max_tokens", 512),
+            ("seed", None),
+        ],
+    )
+    def test_default_value(self, default_llm, field, expected):
+        assert getattr(default_llm, field) == expected
 
 
 class TestLLMConfigValid:
@@ -58,27 +98,29 @@ class TestLLMConfigValid:
 
 
 class TestLLMConfigInvalid:
-    def test_temperature_below_zero_raises_error(self):
-        with pytest.raises(ValidationError):
-            LLMConfig(temperature=-0.1)
-
-    def test_temperature_above_two_raises_error(self):
-        with pytest.raises(ValidationError):
-            LLMConfig(temperature=2.1)
-
-    def test_max_tokens_zero_raises_error(self):
-        with pytest.raises(ValidationError):
-            LLMConfig(max_tokens=0)
-
-    def test_max_tokens_negative_raises_error(self):
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"temperature": -0.1},
+            {"temperature": 2.1},
+            {"max_tokens": 0},
+            {"max_tokens": -1},
+        ],
+        ids=[
+            "temperature-below-zero",
+            "temperature-above-two",
+            "max-tokens-zero",
+            "max-tokens-negative",
+        ],
+    )
+    def test_out_of_range_value_raises_error(self, kwargs):
         with pytest.raises(ValidationError):
-            LLMConfig(max_tokens=-1)
+            LLMConfig(**kwargs)
 
 
 class TestPrismConfig:
-    def test_default_has_llm(self):
-        config = PrismConfig()
-        assert isinstance(config.llm, LLMConfig)
+    def test_default_has_llm(self, default_prism):
+        assert isinstance(default_prism.llm, LLMConfig)
 
     def test_custom_llm(self):
         config = PrismConfig(llm=LLMConfig(model_id="phi3"))
@@ -86,48 +128,51 @@ class TestPrismConfig:
 
 
 class TestLoadConfig:
-    def test_loads_valid_yaml(self, tmp_path):
-        yaml_content = (
-            "llm:\n"
-            "  provider: ollama\n"
-            "  host: http://localhost:11434\n"
-            "  model_id: qwen2.5\n"
-            "  temperature: 0.5\n"
-            "  max_tokens: 256\n"
-        )
-        config_file = tmp_path / "test_config.yaml"
-        config_file.write_text(yaml_content)
-
-        config = load_config(config_file)
+    def test_loads_valid_yaml(self, valid_yaml):
+        config = load_config(valid_yaml)
         assert isinstance(config, PrismConfig)
         assert config.llm.model_id == "qwen2.5"
         assert config.llm.temperature == 0.5
         assert config.llm.max_tokens == 256
 
-    def test_returns_prism_config_with_llm(self, tmp_path):
-        config_file = tmp_path / "test_config.yaml"
-        config_file.write_text("llm:\n  model_id: phi3\n")
-
-        config = load_config(config_file)
+    def test_returns_prism_config_with_llm(self, phi3_yaml):
+        config = load_config(phi3_yaml)
         assert isinstance(config, PrismConfig)
         assert isinstance(config.llm, LLMConfig)
         assert config.llm.model_id == "phi3"
 
+    @pytest.mark.skipif(
+        not yaml.__with_libyaml__, reason="PyYAML built without libyaml"
+    )
+    def test_uses_libyaml_loader_when_available(self):
+        assert SafeYamlLoader is yaml.CSafeLoader
+
     def test_missing_file_raises_file_not_found(self):
         with pytest.raises(FileNotFoundError):
             load_config("/nonexistent/path/config.yaml")
 
-    def test_invalid_values_raise_validation_error(self, tmp_path):
-        config_file = tmp_path / "bad_config.yaml"
-        config_file.write_text("llm:\n  temperature: 5.0\n")
-
+    def test_invalid_values_raise_validation_error(self, invalid_yaml):
         with pytest.raises(ValidationError):
-            load_config(config_file)
-
-    def test_empty_yaml_returns_defaults(self, tmp_path):
-        config_file = tmp_path / "empty.yaml"
-        config_file.write_text("")
+            load_config(invalid_yaml)
 
-        config = load_config(config_file)
+    def test_empty_yaml_returns_defaults(self, empty_yaml):
+        config = load_config(empty_yaml)
         assert config.llm.model_id == "mistral"
         assert config.llm.temperature == 0.7
+
+    def test_reloads_file_after_edit(self, tmp_path):
+        config_file = tmp_path / "test_config.yaml"
+        config_file.write_text("llm:\n  model_id: phi3\n")
+        assert load_config(config_file).llm.model_id == "phi3"
+        mtime_ns = config_file.stat().st_mtime_ns
+
+        # Same size and same mtime: only the content tells the versions apart
+        config_file.write_text("llm:\n  model_id: phi4\n")
+        os.utime(config_file, ns=(mtime_ns, mtime_ns))
+        assert load_config(config_file).llm.model_id == "phi4"
+
+    def test_repeated_loads_return_independent_configs(self, phi3_yaml):
+        first = load_config(phi3_yaml)
+        first.llm.model_id = "changed"
+
+        assert load_config(phi3_yaml).llm.model_id == "phi3"
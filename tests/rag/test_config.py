@@ -3,27 +3,30 @@
 import pytest
 from pydantic import ValidationError
 
+from prism.llm.config import PrismConfig
+from prism.rag.config import RAGConfig
+
+
+@pytest.fixture(scope="module")
+def default_rag():
+    """Default RAGConfig, built once since tests only read it."""
+    return RAGConfig()
+
 
 class TestRAGConfig:
     """Test suite for RAGConfig model."""
 
-    def test_default_values(self):
+    def test_default_values(self, default_rag):
         """RAGConfig has sensible defaults."""
-        from prism.rag.config import RAGConfig
-
-        config = RAGConfig()
-
-        assert config.collection_name == "posts"
-        assert config.embedding_model == "all-MiniLM-L6-v2"
-        assert config.embedding_provider == "sentence-transformers"
-        assert config.persist_directory is None
-        assert config.feed_size == 5
-        assert config.mode == "preference"
+        assert default_rag.collection_name == "posts"
+        assert default_rag.embedding_model == "all-MiniLM-L6-v2"
+        assert default_rag.embedding_provider == "sentence-transformers"
+        assert default_rag.persist_directory is None
+        assert default_rag.feed_size == 5
+        assert default_rag.mode == "preference"
 
     def test_custom_values(self):
         """RAGConfig accepts custom values."""
-        from prism.rag.config import RAGConfig
-
         config = RAGConfig(
             collection_name="simulation_posts",
             embedding_model="nomic-embed-text",
@@ -40,66 +43,41 @@ class TestRAGConfig:
         assert config.feed_size == 10
         assert config.mode == "random"
 
-    def test_feed_size_minimum(self):
-        """feed_size must be at least 1."""
-        from prism.rag.config import RAGConfig
-
+    @pytest.mark.parametrize(
+        ("kwargs", "field"),
+        [
+            ({"feed_size": 0}, "feed_size"),
+            ({"feed_size": 21}, "feed_size"),
+            ({"mode": "hybrid"}, "mode"),
+            ({"embedding_provider": "openai"}, "embedding_provider"),
+        ],
+        ids=["feed-size-zero", "feed-size-21", "mode", "embedding-provider"],
+    )
+    def test_invalid_value_raises_error(self, kwargs, field):
+        """Out-of-range or unknown values raise a validation error naming the field."""
         with pytest.raises(ValidationError) as exc_info:
-            RAGConfig(feed_size=0)
-
-        assert "feed_size" in str(exc_info.value)
+            RAGConfig(**kwargs)
 
-    def test_feed_size_maximum(self):
-        """feed_size must be at most 20."""
-        from prism.rag.config import RAGConfig
-
-        with pytest.raises(ValidationError) as exc_info:
-            RAGConfig(feed_size=21)
-
-        assert "feed_size" in str(exc_info.value)
+        assert field in str(exc_info.value)
 
     def test_feed_size_valid_range(self):
         """feed_size at boundaries is valid."""
-        from prism.rag.config import RAGConfig
-
         config_min = RAGConfig(feed_size=1)
         config_max = RAGConfig(feed_size=20)
 
         assert config_min.feed_size == 1
         assert config_max.feed_size == 20
 
-    def test_invalid_mode(self):
-        """Invalid mode raises validation error."""
-        from prism.rag.config import RAGConfig
-
-        with pytest.raises(ValidationError) as exc_info:
-            RAGConfig(mode="hybrid")
-
-        assert "mode" in str(exc_info.value)
-
     def test_valid_modes(self):
         """Both valid modes are accepted."""
-        from prism.rag.config import RAGConfig
-
         config_pref = RAGConfig(mode="preference")
         config_rand = RAGConfig(mode="random")
 
         assert config_pref.mode == "preference"
         assert config_rand.mode == "random"
 
-    def test_invalid_embedding_provider(self):
-        """Invalid embedding_provider raises validation error."""
-        from prism.rag.config import RAGConfig
-
-        with pytest.raises(ValidationError) as exc_info:
-            RAGConfig(embedding_provider="openai")
-
-        assert "embedding_provider" in str(exc_info.value)
-
     def test_valid_embedding_providers(self):
         """Both valid embedding providers are accepted."""
-        from prism.rag.config import RAGConfig
-
         config_st = RAGConfig(embedding_provider="sentence-transformers")
         config_ol = RAGConfig(embedding_provider="ollama")
 
@@ -110,31 +88,19 @@ class TestRAGConfig:
 class TestPrismConfigIntegration:
     """Test RAGConfig integration with PrismConfig."""
 
-    def test_prism_config_has_rag_section(self):
+    def test_prism_config_has_rag_section(self, default_prism):
         """PrismConfig includes a rag field of type RAGConfig."""
-        from prism.llm.config import PrismConfig
-        from prism.rag.config import RAGConfig
+        assert hasattr(default_prism, "rag")
+        assert isinstance(default_prism.rag, RAGConfig)
 
-        config = PrismConfig()
-
-        assert hasattr(config, "rag")
-        assert isinstance(config.rag, RAGConfig)
-
-    def test_prism_config_rag_defaults(self):
+    def test_prism_config_rag_defaults(self, default_prism):
         """PrismConfig rag section has default RAGConfig values."""
-        from prism.llm.config import PrismConfig
-
-        config = PrismConfig()
-
-        assert config.rag.collection_name == "posts"
-        assert config.rag.feed_size == 5
-        assert config.rag.mode == "preference"
+        assert default_prism.rag.collection_name == "posts"
+        assert default_prism.rag.feed_size == 5
+        assert default_prism.rag.mode == "preference"
 
     def test_prism_config_custom_rag(self):
         """PrismConfig accepts custom rag configuration."""
-        from prism.llm.config import PrismConfig
-        from prism.rag.config import RAGConfig
-
         config = PrismConfig(
             rag=RAGConfig(
                 collection_name="custom_posts",
@@ -147,14 +113,10 @@ class TestPrismConfigIntegration:
         assert config.rag.feed_size == 10
         assert config.rag.mode == "random"
 
-    def test_load_config_includes_rag(self):
+    def test_load_config_includes_rag(self, default_prism_config):
         """load_config loads RAG section from YAML."""
-        from prism.llm.config import load_config
-
-        config = load_config("configs/default.yaml")
-
         # Verify RAG section is loaded (with whatever values are in file)
-        assert hasattr(config, "rag")
-        assert config.rag.collection_name is not None
-        assert config.rag.feed_size >= 1
-        assert config.rag.mode in ("preference", "random")
+        assert hasattr(default_prism_config, "rag")
+        assert default_prism_config.rag.collection_name is not None
+        assert default_prism_config.rag.feed_size >= 1
+        assert default_prism_config.rag.mode in ("preference", "random")
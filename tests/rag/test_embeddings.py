@@ -140,13 +140,14 @@ class TestOllamaEmbeddingFunction:
                 ef._embed_single("test text")
 
     @pytest.mark.integration
-    def test_calls_ollama_api(self):
+    @pytest.mark.requires_ollama
+    def test_calls_ollama_api(self, default_prism_config):
         """Integration test: actually calls Ollama API (requires running Ollama)."""
-        from prism.llm.config import load_config
         from prism.rag.embeddings import OllamaEmbeddingFunction
 
-        config = load_config("configs/default.yaml")
-        ef = OllamaEmbeddingFunction(model="nomic-embed-text", host=config.llm.host)
+        ef = OllamaEmbeddingFunction(
+            model="nomic-embed-text", host=default_prism_config.llm.host
+        )
         result = ef(["Hello world"])
 
         # Should return a list with one embedding vector
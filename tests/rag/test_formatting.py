@@ -4,6 +4,9 @@ from datetime import datetime, timedelta
 
 from prism.rag.models import Post
 
+# Fixed reference time so relative timestamps are deterministic
+_NOW = datetime(2026, 1, 29, 12, 0, 0)
+
 
 class TestFormatRelativeTime:
     """Test suite for format_relative_time() helper function."""
@@ -12,10 +15,9 @@ class TestFormatRelativeTime:
         """Recent timestamps show 'just now'."""
         from prism.rag.formatting import format_relative_time
 
-        now = datetime.now()
-        timestamp = now - timedelta(seconds=30)
+        timestamp = _NOW - timedelta(seconds=30)
 
-        result = format_relative_time(timestamp, now)
+        result = format_relative_time(timestamp, _NOW)
 
         assert result == "just now"
 
@@ -23,10 +25,9 @@ class TestFormatRelativeTime:
         """Minutes ago formatted correctly."""
         from prism.rag.formatting import format_relative_time
 
-        now = datetime.now()
-        timestamp = now - timedelta(minutes=5)
+        timestamp = _NOW - timedelta(minutes=5)
 
-        result = format_relative_time(timestamp, now)
+        result = format_relative_time(timestamp, _NOW)
 
         assert result == "5m ago"
 
@@ -34,10 +35,9 @@ class TestFormatRelativeTime:
         """One minute ago formatted correctly."""
         from prism.rag.formatting import format_relative_time
 
-        now = datetime.now()
-        timestamp = now - timedelta(minutes=1)
+        timestamp = _NOW - timedelta(minutes=1)
 
-        result = format_relative_time(timestamp, now)
+        result = format_relative_time(timestamp, _NOW)
 
         assert result == "1m ago"
 
@@ -45,10 +45,9 @@ class TestFormatRelativeTime:
         """Hours ago formatted correctly."""
         from prism.rag.formatting import format_relative_time
 
-        now = datetime.now()
-        timestamp = now - timedelta(hours=3)
+        timestamp = _NOW - timedelta(hours=3)
 
-        result = format_relative_time(timestamp, now)
+        result = format_relative_time(timestamp, _NOW)
 
         assert result == "3h ago"
 
@@ -56,10 +55,9 @@ class TestFormatRelativeTime:
         """One hour ago formatted correctly."""
         from prism.rag.formatting import format_relative_time
 
-        now = datetime.now()
-        timestamp = now - timedelta(hours=1)
+        timestamp = _NOW - timedelta(hours=1)
 
-        result = format_relative_time(timestamp, now)
+        result = format_relative_time(timestamp, _NOW)
 
         assert result == "1h ago"
 
@@ -67,10 +65,9 @@ class TestFormatRelativeTime:
         """Days ago formatted correctly."""
         from prism.rag.formatting import format_relative_time
 
-        now = datetime.now()
-        timestamp = now - timedelta(days=2)
+        timestamp = _NOW - timedelta(days=2)
 
-        result = format_relative_time(timestamp, now)
+        result = format_relative_time(timestamp, _NOW)
 
         assert result == "2d ago"
 
@@ -78,10 +75,9 @@ class TestFormatRelativeTime:
         """One day ago formatted correctly."""
         from prism.rag.formatting import format_relative_time
 
-        now = datetime.now()
-        timestamp = now - timedelta(days=1)
+        timestamp = _NOW - timedelta(days=1)
 
-        result = format_relative_time(timestamp, now)
+        result = format_relative_time(timestamp, _NOW)
 
         assert result == "1d ago"
 
@@ -89,10 +85,9 @@ class TestFormatRelativeTime:
         """Weeks ago formatted correctly."""
         from prism.rag.formatting import format_relative_time
 
-        now = datetime.now()
-        timestamp = now - timedelta(weeks=2)
+        timestamp = _NOW - timedelta(weeks=2)
 
-        result = format_relative_time(timestamp, now)
+        result = format_relative_time(timestamp, _NOW)
 
         assert result == "2w ago"
 
@@ -100,10 +95,9 @@ class TestFormatRelativeTime:
         """59 minutes shows minutes, not hours."""
         from prism.rag.formatting import format_relative_time
 
-        now = datetime.now()
-        timestamp = now - timedelta(minutes=59)
+        timestamp = _NOW - timedelta(minutes=59)
 
-        result = format_relative_time(timestamp, now)
+        result = format_relative_time(timestamp, _NOW)
 
         assert result == "59m ago"
 
@@ -111,10 +105,9 @@ class TestFormatRelativeTime:
         """23 hours shows hours, not days."""
         from prism.rag.formatting import format_relative_time
 
-        now = datetime.now()
-        timestamp = now - timedelta(hours=23)
+        timestamp = _NOW - timedelta(hours=23)
 
-        result = format_relative_time(timestamp, now)
+        result = format_relative_time(timestamp, _NOW)
 
         assert result == "23h ago"
 
@@ -131,11 +124,11 @@ class TestFormatFeedForPrompt:
                 id="post_001",
                 author_id="agent_1",
                 text="Hello world",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
             )
         ]
 
-        result = format_feed_for_prompt(posts)
+        result = format_feed_for_prompt(posts, _NOW)
 
         assert isinstance(result, str)
 
@@ -148,11 +141,11 @@ class TestFormatFeedForPrompt:
                 id="post_001",
                 author_id="agent_1",
                 text="My local coffee shop now accepts Bitcoin!",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
             )
         ]
 
-        result = format_feed_for_prompt(posts)
+        result = format_feed_for_prompt(posts, _NOW)
 
         assert "My local coffee shop now accepts Bitcoin!" in result
 
@@ -165,17 +158,17 @@ class TestFormatFeedForPrompt:
                 id="post_001",
                 author_id="agent_1",
                 text="First post",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
             ),
             Post(
                 id="post_002",
                 author_id="agent_2",
                 text="Second post",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
             ),
         ]
 
-        result = format_feed_for_prompt(posts)
+        result = format_feed_for_prompt(posts, _NOW)
 
         assert "Post #1:" in result
         assert "Post #2:" in result
@@ -189,14 +182,14 @@ class TestFormatFeedForPrompt:
                 id="post_001",
                 author_id="agent_1",
                 text="Check this out",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
                 has_media=True,
                 media_type="image",
                 media_description="A photo of sunset",
             )
         ]
 
-        result = format_feed_for_prompt(posts)
+        result = format_feed_for_prompt(posts, _NOW)
 
         assert "[" in result and "IMAGE:" in result
         assert "A photo of sunset" in result
@@ -210,14 +203,14 @@ class TestFormatFeedForPrompt:
                 id="post_001",
                 author_id="agent_1",
                 text="Photo post",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
                 has_media=True,
                 media_type="image",
                 media_description="Test image",
             )
         ]
 
-        result = format_feed_for_prompt(posts)
+        result = format_feed_for_prompt(posts, _NOW)
 
         assert "IMAGE:" in result
 
@@ -230,14 +223,14 @@ class TestFormatFeedForPrompt:
                 id="post_001",
                 author_id="agent_1",
                 text="Video post",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
                 has_media=True,
                 media_type="video",
                 media_description="Test video",
             )
         ]
 
-        result = format_feed_for_prompt(posts)
+        result = format_feed_for_prompt(posts, _NOW)
 
         assert "VIDEO:" in result
 
@@ -250,14 +243,14 @@ class TestFormatFeedForPrompt:
                 id="post_001",
                 author_id="agent_1",
                 text="GIF post",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
                 has_media=True,
                 media_type="gif",
                 media_description="Funny animation",
             )
         ]
 
-        result = format_feed_for_prompt(posts)
+        result = format_feed_for_prompt(posts, _NOW)
 
         assert "GIF:" in result
 
@@ -270,12 +263,12 @@ class TestFormatFeedForPrompt:
                 id="post_001",
                 author_id="agent_1",
                 text="Text only post",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
                 has_media=False,
             )
         ]
 
-        result = format_feed_for_prompt(posts)
+        result = format_feed_for_prompt(posts, _NOW)
 
         assert "IMAGE:" not in result
         assert "VIDEO:" not in result
@@ -290,12 +283,12 @@ class TestFormatFeedForPrompt:
                 id="post_001",
                 author_id="agent_1",
                 text="Popular post",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
                 likes=89,
             )
         ]
 
-        result = format_feed_for_prompt(posts)
+        result = format_feed_for_prompt(posts, _NOW)
 
         assert "89" in result
 
@@ -308,12 +301,12 @@ class TestFormatFeedForPrompt:
                 id="post_001",
                 author_id="agent_1",
                 text="Viral post",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
                 reshares=34,
             )
         ]
 
-        result = format_feed_for_prompt(posts)
+        result = format_feed_for_prompt(posts, _NOW)
 
         assert "34" in result
 
@@ -326,12 +319,12 @@ class TestFormatFeedForPrompt:
                 id="post_001",
                 author_id="agent_1",
                 text="Discussion post",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
                 replies=12,
             )
         ]
 
-        result = format_feed_for_prompt(posts)
+        result = format_feed_for_prompt(posts, _NOW)
 
         assert "12" in result
 
@@ -344,11 +337,11 @@ class TestFormatFeedForPrompt:
                 id="post_001",
                 author_id="agent_1",
                 text="Recent post",
-                timestamp=datetime.now() - timedelta(hours=3),
+                timestamp=_NOW - timedelta(hours=3),
             )
         ]
 
-        result = format_feed_for_prompt(posts)
+        result = format_feed_for_prompt(posts, _NOW)
 
         assert "3h ago" in result
 
@@ -369,17 +362,17 @@ class TestFormatFeedForPrompt:
                 id="post_001",
                 author_id="agent_1",
                 text="First post",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
             ),
             Post(
                 id="post_002",
                 author_id="agent_2",
                 text="Second post",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
             ),
         ]
 
-        result = format_feed_for_prompt(posts)
+        result = format_feed_for_prompt(posts, _NOW)
 
         # Should have both posts
         assert "First post" in result
@@ -396,7 +389,7 @@ class TestFormatFeedForPrompt:
                 id="post_001",
                 author_id="agent_42",
                 text="Just mass adoption? My local coffee shop accepts Bitcoin!",
-                timestamp=datetime.now() - timedelta(hours=3),
+                timestamp=_NOW - timedelta(hours=3),
                 has_media=True,
                 media_type="image",
                 media_description="Photo of coffee shop with Bitcoin payment terminal",
@@ -406,7 +399,7 @@ class TestFormatFeedForPrompt:
             )
         ]
 
-        result = format_feed_for_prompt(posts)
+        result = format_feed_for_prompt(posts, _NOW)
 
         # Check all elements are present
         assert "Post #1:" in result
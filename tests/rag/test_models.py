@@ -5,6 +5,9 @@ from datetime import datetime
 import pytest
 from pydantic import ValidationError
 
+# Fixed timestamp for posts whose time doesn't matter to the test
+_NOW = datetime(2026, 1, 29, 12, 0, 0)
+
 
 class TestPostModel:
     """Test suite for Post model."""
@@ -59,38 +62,12 @@ class TestPostModel:
         assert post.replies == 0
         assert post.velocity == 0.0
 
-    def test_post_negative_likes_raises_error(self):
-        """Negative likes raises validation error."""
-        from prism.rag.models import Post
-
-        with pytest.raises(ValidationError) as exc_info:
-            Post(
-                id="post_003",
-                author_id="agent_1",
-                text="Test post",
-                timestamp=datetime.now(),
-                likes=-5,
-            )
-
-        assert "likes" in str(exc_info.value)
-
-    def test_post_negative_reshares_raises_error(self):
-        """Negative reshares raises validation error."""
-        from prism.rag.models import Post
-
-        with pytest.raises(ValidationError) as exc_info:
-            Post(
-                id="post_003",
-                author_id="agent_1",
-                text="Test post",
-                timestamp=datetime.now(),
-                reshares=-1,
-            )
-
-        assert "reshares" in str(exc_info.value)
-
-    def test_post_negative_replies_raises_error(self):
-        """Negative replies raises validation error."""
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [("likes", -5), ("reshares", -1), ("replies", -10), ("velocity", -0.5)],
+    )
+    def test_post_negative_metric_raises_error(self, field, value):
+        """Negative engagement metrics raise validation error."""
         from prism.rag.models import Post
 
         with pytest.raises(ValidationError) as exc_info:
@@ -98,26 +75,11 @@ class TestPostModel:
                 id="post_003",
                 author_id="agent_1",
                 text="Test post",
-                timestamp=datetime.now(),
-                replies=-10,
+                timestamp=_NOW,
+                **{field: value},
             )
 
-        assert "replies" in str(exc_info.value)
-
-    def test_post_negative_velocity_raises_error(self):
-        """Negative velocity raises validation error."""
-        from prism.rag.models import Post
-
-        with pytest.raises(ValidationError) as exc_info:
-            Post(
-                id="post_003",
-                author_id="agent_1",
-                text="Test post",
-                timestamp=datetime.now(),
-                velocity=-0.5,
-            )
-
-        assert "velocity" in str(exc_info.value)
+        assert field in str(exc_info.value)
 
     def test_post_invalid_media_type_raises_error(self):
         """Invalid media_type raises validation error."""
@@ -128,7 +90,7 @@ class TestPostModel:
                 id="post_003",
                 author_id="agent_1",
                 text="Test post",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
                 has_media=True,
                 media_type="audio",  # Invalid - only image, video, gif allowed
             )
@@ -144,7 +106,7 @@ class TestPostModel:
                 id=f"post_{media_type}",
                 author_id="agent_1",
                 text="Test post",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
                 has_media=True,
                 media_type=media_type,
             )
@@ -162,7 +124,7 @@ class TestPostMediaConsistency:
             id="post_1",
             author_id="agent_1",
             text="Test post",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             has_media=False,
             media_type=None,
         )
@@ -177,7 +139,7 @@ class TestPostMediaConsistency:
             id="post_1",
             author_id="agent_1",
             text="Test post",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             has_media=True,
             media_type="image",
         )
@@ -193,7 +155,7 @@ class TestPostMediaConsistency:
                 id="post_1",
                 author_id="agent_1",
                 text="Test post",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
                 has_media=False,
                 media_type="image",
             )
@@ -208,7 +170,7 @@ class TestPostMediaConsistency:
             id="post_1",
             author_id="agent_1",
             text="Test post",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             has_media=True,
             media_type=None,
         )
@@ -217,13 +179,17 @@ class TestPostMediaConsistency:
 
 
 class TestPostChromaConversion:
-    """Test suite for Post ChromaDB conversion methods."""
+    """Test suite for Post ChromaDB conversion methods.
+
+    Posts built here are known-valid inputs to the conversions, so they
+    skip validation; TestPostModel covers construction.
+    """
 
     def test_to_metadata_returns_dict(self):
         """to_metadata returns a dict with all fields."""
         from prism.rag.models import Post
 
-        post = Post(
+        post = Post.model_construct(
             id="post_001",
             author_id="agent_42",
             text="Test post content",
@@ -254,11 +220,11 @@ class TestPostChromaConversion:
         """to_metadata does not include id and text (stored separately in ChromaDB)."""
         from prism.rag.models import Post
 
-        post = Post(
+        post = Post.model_construct(
             id="post_001",
             author_id="agent_1",
             text="Test content",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
         )
 
         metadata = post.to_metadata()
@@ -329,7 +295,7 @@ class TestPostChromaConversion:
         """Post survives roundtrip through to_metadata and from_chroma_result."""
         from prism.rag.models import Post
 
-        original = Post(
+        original = Post.model_construct(
             id="post_roundtrip",
             author_id="agent_test",
             text="Roundtrip test content",
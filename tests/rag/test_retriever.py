@@ -11,9 +11,9 @@ from prism.rag.models import Post
 from prism.rag.retriever import FeedRetriever
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def embedding_function():
-    """Create a sentence-transformer embedding function for tests."""
+    """Create a sentence-transformer embedding function shared by all tests."""
     return SentenceTransformerEmbeddingFunction(model_name="all-MiniLM-L6-v2")
 
 
@@ -29,10 +29,14 @@ def collection(embedding_function):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_post():
-    """Create a sample post for testing."""
-    return Post(
+    """Create a sample post for testing.
+
+    Fixture posts are known-valid, so they skip pydantic validation. Shared
+    across the session, so tests must not mutate it.
+    """
+    return Post.model_construct(
         id="post_001",
         author_id="agent_42",
         text="My local coffee shop now accepts Bitcoin!",
@@ -47,18 +51,21 @@ def sample_post():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_posts():
-    """Create a list of sample posts for testing."""
+    """Create a list of known-valid sample posts, skipping validation.
+
+    Shared across the session, so tests must not mutate the list or its posts.
+    """
     return [
-        Post(
+        Post.model_construct(
             id="post_001",
             author_id="agent_1",
             text="Bitcoin and crypto are the future of finance!",
             timestamp=datetime(2026, 1, 29, 10, 0, 0),
             likes=100,
         ),
-        Post(
+        Post.model_construct(
             id="post_002",
             author_id="agent_2",
             text="Just adopted a cute puppy from the shelter!",
@@ -68,21 +75,21 @@ def sample_posts():
             media_description="Golden retriever puppy",
             likes=250,
         ),
-        Post(
+        Post.model_construct(
             id="post_003",
             author_id="agent_3",
             text="New AI model released, impressive capabilities in coding",
             timestamp=datetime(2026, 1, 29, 12, 0, 0),
             likes=75,
         ),
-        Post(
+        Post.model_construct(
             id="post_004",
             author_id="agent_4",
             text="Ethereum smart contracts are revolutionizing DeFi",
             timestamp=datetime(2026, 1, 29, 13, 0, 0),
             likes=60,
         ),
-        Post(
+        Post.model_construct(
             id="post_005",
             author_id="agent_5",
             text="Beautiful sunset at the beach today",
@@ -4,8 +4,6 @@ from datetime import datetime, timezone
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from prism.rag.models import Post
 from prism.simulation.executors.decision import AgentDecisionExecutor
 from prism.simulation.results import DecisionResult
@@ -51,7 +49,6 @@ def create_test_post() -> Post:
 class TestAgentDecisionExecutor:
     """Tests for AgentDecisionExecutor."""
 
-    @pytest.mark.asyncio
     async def test_execute_calls_agent_tick(self) -> None:
         """T067: execute should call agent.tick() at start."""
         # Arrange
@@ -67,7 +64,6 @@ class TestAgentDecisionExecutor:
         # Assert
         agent.tick.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_execute_calls_statechart_fire(self) -> None:
         """T069: execute should call statechart.fire with correct args."""
         # Arrange
@@ -96,7 +92,6 @@ class TestAgentDecisionExecutor:
             assert call_args[1]["agent"] == agent
             assert "context" in call_args[1]
 
-    @pytest.mark.asyncio
     async def test_execute_detects_multiple_valid_targets(self) -> None:
         """T071: execute should detect multiple valid targets."""
         # Arrange - EVALUATING + decides has multiple possible targets
@@ -109,7 +104,6 @@ class TestAgentDecisionExecutor:
         # Assert multiple targets exist
         assert len(targets) > 1
 
-    @pytest.mark.asyncio
     async def test_execute_calls_reasoner_when_ambiguous(self) -> None:
         """T073: execute should call reasoner when ambiguous targets exist."""
         # Arrange - Statechart where fire() returns None but valid_targets has multiple
@@ -171,7 +165,6 @@ class TestAgentDecisionExecutor:
         assert result.reasoner_used is True
         assert result.to_state == AgentState.ENGAGING_LIKE
 
-    @pytest.mark.asyncio
     async def test_execute_calls_transition_to(self) -> None:
         """T075: execute should call agent.transition_to."""
         # Arrange
@@ -190,7 +183,6 @@ class TestAgentDecisionExecutor:
         assert call_args[0][0] == AgentState.SCROLLING
         assert call_args[0][1] == "start_browsing"
 
-    @pytest.mark.asyncio
     async def test_execute_returns_decision_result(self) -> None:
         """T077: execute should return DecisionResult."""
         # Arrange
@@ -210,7 +202,6 @@ class TestAgentDecisionExecutor:
         assert result.from_state == AgentState.IDLE
         assert result.to_state == AgentState.SCROLLING
 
-    @pytest.mark.asyncio
     async def test_execute_action_for_composing_state(self) -> None:
         """T079: execute should return action based on new state - COMPOSING."""
         # Arrange
@@ -227,7 +218,6 @@ class TestAgentDecisionExecutor:
         assert result.action is not None
         assert result.action.action == "compose"
 
-    @pytest.mark.asyncio
     async def test_execute_action_for_engaging_like_state(self) -> None:
         """T079: execute should return action based on new state - ENGAGING_LIKE."""
         # Arrange
@@ -246,7 +236,6 @@ class TestAgentDecisionExecutor:
         assert result.action.action == "like"
         assert result.action.target_post_id == post.id
 
-    @pytest.mark.asyncio
     async def test_execute_action_for_engaging_reply_state(self) -> None:
         """T079: execute should return action - ENGAGING_REPLY."""
         # Arrange
@@ -265,7 +254,6 @@ class TestAgentDecisionExecutor:
         assert result.action.action == "reply"
         assert result.action.target_post_id == post.id
 
-    @pytest.mark.asyncio
     async def test_execute_action_for_engaging_reshare_state(self) -> None:
         """T079: execute should return action - ENGAGING_RESHARE."""
         # Arrange
@@ -284,7 +272,6 @@ class TestAgentDecisionExecutor:
         assert result.action.action == "reshare"
         assert result.action.target_post_id == post.id
 
-    @pytest.mark.asyncio
     async def test_execute_scroll_action_for_non_engagement_state(self) -> None:
         """T079: execute should return scroll action for SCROLLING state."""
         # Arrange
@@ -301,7 +288,6 @@ class TestAgentDecisionExecutor:
         assert result.action is not None
         assert result.action.action == "scroll"
 
-    @pytest.mark.asyncio
     async def test_execute_timeout_trigger(self) -> None:
         """execute should use timeout trigger when agent.is_timed_out() is True."""
         # Arrange
@@ -319,7 +305,6 @@ class TestAgentDecisionExecutor:
         assert result.trigger == "timeout"
         assert result.to_state == AgentState.IDLE
 
-    @pytest.mark.asyncio
     async def test_execute_without_reasoner_uses_first_target(self) -> None:
         """execute should use first valid target when reasoner is None."""
         # Arrange - EVALUATING has multiple targets but no reasoner
@@ -348,7 +333,6 @@ class TestAgentDecisionExecutor:
             AgentState.SCROLLING,
         ]
 
-    @pytest.mark.asyncio
     async def test_execute_stays_in_state_when_no_valid_transition(self) -> None:
         """execute should stay in current state when no valid transition exists."""
         # Arrange - IDLE state but somehow no valid transition
@@ -3,8 +3,6 @@
 from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
-import pytest
-
 from prism.rag.models import Post
 from prism.simulation.executors.feed import FeedRetrievalExecutor
 
@@ -90,7 +88,6 @@ class TestFeedRetrievalExecutor:
         assert result == []
 
 
-@pytest.mark.asyncio
 class TestFeedRetrievalExecutorAsync:
     """Async tests for FeedRetrievalExecutor."""
 
@@ -35,7 +35,6 @@ def create_test_state() -> SimulationState:
 class TestLoggingExecutor:
     """Tests for LoggingExecutor."""
 
-    @pytest.mark.asyncio
     async def test_execute_logs_json_entry(
         self, caplog: pytest.LogCaptureFixture
     ) -> None:
@@ -64,7 +63,6 @@ class TestLoggingExecutor:
         entry = json.loads(log_text)
         assert isinstance(entry, dict)
 
-    @pytest.mark.asyncio
     async def test_log_entry_contains_required_fields(
         self, caplog: pytest.LogCaptureFixture
     ) -> None:
@@ -105,7 +103,6 @@ class TestLoggingExecutor:
         assert "action_type" in entry
         assert entry["action_type"] == "scroll"
 
-    @pytest.mark.asyncio
     async def test_writes_to_file_when_configured(self, tmp_path: Path) -> None:
         """T095: executor should write to file when log_file is configured."""
         # Arrange
@@ -137,7 +134,6 @@ class TestLoggingExecutor:
         assert entry["agent_id"] == "test_agent"
         assert entry["trigger"] == "sees_post"
 
-    @pytest.mark.asyncio
     async def test_multiple_writes_to_file(self, tmp_path: Path) -> None:
         """executor should write multiple entries to file."""
         # Arrange
@@ -178,7 +174,6 @@ class TestLoggingExecutor:
         assert entry1["agent_id"] == "agent1"
         assert entry2["agent_id"] == "agent2"
 
-    @pytest.mark.asyncio
     async def test_handles_none_action(self, caplog: pytest.LogCaptureFixture) -> None:
         """executor should handle None action gracefully."""
         # Arrange
@@ -204,7 +199,6 @@ class TestLoggingExecutor:
         entry = json.loads(log_text)
         assert entry["action_type"] is None
 
-    @pytest.mark.asyncio
     async def test_includes_reasoner_used_field(
         self, caplog: pytest.LogCaptureFixture
     ) -> None:
@@ -233,7 +227,6 @@ class TestLoggingExecutor:
         entry = json.loads(log_text)
         assert entry["reasoner_used"] is True
 
-    @pytest.mark.asyncio
     async def test_context_manager_closes_file(self, tmp_path: Path) -> None:
         """Context manager should ensure file handle is closed."""
         # Arrange
@@ -265,7 +258,6 @@ class TestLoggingExecutor:
         entry = json.loads(lines[0])
         assert entry["agent_id"] == "test_agent"
 
-    @pytest.mark.asyncio
     async def test_context_manager_closes_on_exception(self, tmp_path: Path) -> None:
         """Context manager should close file even when exception occurs."""
         # Arrange
@@ -3,8 +3,6 @@
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
-
 from prism.rag.models import Post
 from prism.simulation.executors.round import AgentRoundExecutor
 from prism.simulation.results import ActionResult, DecisionResult
@@ -45,7 +43,6 @@ def create_test_post() -> Post:
 class TestAgentRoundExecutor:
     """Tests for AgentRoundExecutor."""
 
-    @pytest.mark.asyncio
     async def test_execute_coordinates_pipeline(self) -> None:
         """T097: executor should coordinate feed, decision, state, logging pipeline."""
         # Arrange
@@ -85,7 +82,6 @@ class TestAgentRoundExecutor:
         mock_state_exec.execute.assert_called_once()
         mock_logging_exec.execute.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_execute_returns_decision_result(self) -> None:
         """T099: executor should return DecisionResult from decision executor."""
         # Arrange
@@ -126,7 +122,6 @@ class TestAgentRoundExecutor:
         assert result.from_state == AgentState.IDLE
         assert result.to_state == AgentState.SCROLLING
 
-    @pytest.mark.asyncio
     async def test_passes_feed_to_decision_executor(self) -> None:
         """decision executor should receive feed from feed executor."""
         # Arrange
@@ -164,7 +159,6 @@ class TestAgentRoundExecutor:
         assert "feed" in call_kwargs
         assert call_kwargs["feed"] == posts
 
-    @pytest.mark.asyncio
     async def test_passes_decision_to_state_executor(self) -> None:
         """state executor should receive decision from decision executor."""
         # Arrange
@@ -3,8 +3,6 @@
 from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
-import pytest
-
 from prism.rag.models import Post
 from prism.simulation.executors.state_update import StateUpdateExecutor
 from prism.simulation.results import ActionResult, DecisionResult
@@ -48,7 +46,6 @@ def create_test_state(posts: list[Post] | None = None) -> SimulationState:
 class TestStateUpdateExecutor:
     """Tests for StateUpdateExecutor."""
 
-    @pytest.mark.asyncio
     async def test_handles_like_action(self) -> None:
         """T081: executor should handle like action - increment metrics."""
         # Arrange
@@ -73,7 +70,6 @@ class TestStateUpdateExecutor:
         assert post.likes == 1
         assert state.metrics.total_likes == 1
 
-    @pytest.mark.asyncio
     async def test_handles_reply_action(self) -> None:
         """T083: executor should handle reply action - increment replies + add post."""
         # Arrange
@@ -114,7 +110,6 @@ class TestStateUpdateExecutor:
         assert state.posts[1].id == "p2"
         mock_retriever.add_post.assert_called_once_with(reply_post)
 
-    @pytest.mark.asyncio
     async def test_handles_reshare_action(self) -> None:
         """T085: executor should handle reshare action."""
         # Arrange
@@ -150,7 +145,6 @@ class TestStateUpdateExecutor:
         assert len(state.posts) == 2
         mock_retriever.add_post.assert_called_once_with(reshare_post)
 
-    @pytest.mark.asyncio
     async def test_handles_compose_action(self) -> None:
         """T087: executor should handle compose action - add new post."""
         # Arrange
@@ -185,7 +179,6 @@ class TestStateUpdateExecutor:
         assert state.metrics.posts_created == 1
         mock_retriever.add_post.assert_called_once_with(new_post)
 
-    @pytest.mark.asyncio
     async def test_handles_scroll_action_no_changes(self) -> None:
         """T089: executor should handle scroll action - no changes."""
         # Arrange
@@ -214,7 +207,6 @@ class TestStateUpdateExecutor:
         assert len(state.posts) == 1
         mock_retriever.add_post.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_handles_none_action(self) -> None:
         """executor should handle None action gracefully."""
         # Arrange
@@ -237,7 +229,6 @@ class TestStateUpdateExecutor:
         # Assert - no errors
         mock_retriever.add_post.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_like_nonexistent_post_is_noop(self) -> None:
         """executor should handle like on non-existent post gracefully."""
         # Arrange
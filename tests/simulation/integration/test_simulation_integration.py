@@ -122,7 +122,6 @@ class TestSimulationCompletes:
             logging_executor=logging_exec,
         )
 
-    @pytest.mark.asyncio
     async def test_simulation_completes_3_agents_2_rounds(
         self,
         config: SimulationConfig,
@@ -149,7 +148,6 @@ class TestSimulationCompletes:
         for round_result in result.rounds:
             assert len(round_result.decisions) == 3
 
-    @pytest.mark.asyncio
     async def test_agents_transition_from_idle(
         self,
         config: SimulationConfig,
@@ -216,7 +214,6 @@ class TestCheckpointResume:
             logging_executor=logging_exec,
         )
 
-    @pytest.mark.asyncio
     async def test_checkpoint_saves_to_file(
         self,
         tmp_path: Path,
@@ -245,7 +242,6 @@ class TestCheckpointResume:
         checkpoints = list(tmp_path.glob("checkpoint_round_*.json"))
         assert len(checkpoints) > 0
 
-    @pytest.mark.asyncio
     async def test_checkpoint_contains_state_distribution(
         self,
         tmp_path: Path,
@@ -309,7 +305,6 @@ class TestStateDistributionLogging:
         """Create mock retriever."""
         return MockFeedRetriever(posts)
 
-    @pytest.mark.asyncio
     async def test_logging_executor_writes_to_file(
         self,
         tmp_path: Path,
@@ -367,7 +362,6 @@ class TestStateDistributionLogging:
             assert "from_state" in entry
             assert "to_state" in entry
 
-    @pytest.mark.asyncio
     async def test_decision_result_includes_states(
         self,
         posts: list[Post],
@@ -427,7 +421,6 @@ class TestSimulationWiring:
     def retriever(self, posts: list[Post]) -> MockFeedRetriever:
         return MockFeedRetriever(posts)
 
-    @pytest.mark.asyncio
     async def test_controller_calls_round_executor_for_each_agent(
         self,
         posts: list[Post],
@@ -464,7 +457,6 @@ class TestSimulationWiring:
         total_decisions = sum(len(r.decisions) for r in result.rounds)
         assert total_decisions == 9
 
-    @pytest.mark.asyncio
     async def test_state_advances_each_round(
         self,
         posts: list[Post],
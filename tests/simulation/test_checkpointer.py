@@ -406,6 +406,32 @@ class TestCheckpointerLoad:
         assert loaded_state.round_number == 5
         assert loaded_state.metrics.total_likes == 10
 
+    def test_load_with_agent_factory_coerces_state_to_enum(
+        self, tmp_path: Path
+    ) -> None:
+        """Agents built by agent_factory get AgentState singletons as state."""
+        # Arrange
+        checkpoint_dir = tmp_path / "checkpoints"
+        checkpointer = Checkpointer(checkpoint_dir)
+        statechart = create_social_media_statechart()
+        state = SimulationState(agents=[create_mock_agent()], statechart=statechart)
+        saved_path = checkpointer.save(state)
+
+        def agent_factory(data: dict) -> MagicMock:
+            agent = MagicMock()
+            agent.state = data["state"]  # Raw string from JSON
+            return agent
+
+        # Act
+        loaded_state = checkpointer.load(
+            path=saved_path,
+            statechart=statechart,
+            agent_factory=agent_factory,
+        )
+
+        # Assert
+        assert loaded_state.agents[0].state is AgentState.SCROLLING
+
 
 class TestCheckpointerFinders:
     """Tests for Checkpointer.latest_checkpoint and checkpoint_for_round."""
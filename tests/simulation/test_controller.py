@@ -7,8 +7,6 @@ simulation rounds, agent processing, and checkpointing.
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
-
 from prism.simulation.checkpointer import Checkpointer
 from prism.simulation.config import SimulationConfig
 from prism.simulation.controller import RoundController
@@ -51,7 +49,6 @@ def create_mock_round_executor() -> MagicMock:
 class TestRoundControllerRunSimulation:
     """Tests for RoundController.run_simulation method."""
 
-    @pytest.mark.asyncio
     async def test_run_simulation_iterates_rounds(self, tmp_path: Path) -> None:
         """T117: run_simulation iterates for max_rounds."""
         # Arrange
@@ -71,7 +68,6 @@ class TestRoundControllerRunSimulation:
         # Each round, each agent gets executed once
         assert round_executor.execute.await_count == 3  # 1 agent × 3 rounds
 
-    @pytest.mark.asyncio
     async def test_controller_processes_all_agents_each_round(
         self, tmp_path: Path
     ) -> None:
@@ -91,7 +87,6 @@ class TestRoundControllerRunSimulation:
         # Assert - 5 agents × 2 rounds = 10 executions
         assert round_executor.execute.await_count == 10
 
-    @pytest.mark.asyncio
     async def test_controller_saves_checkpoints_at_frequency(
         self, tmp_path: Path
     ) -> None:
@@ -118,7 +113,6 @@ class TestRoundControllerRunSimulation:
         checkpoints = list(checkpoint_dir.glob("checkpoint_round_*.json"))
         assert len(checkpoints) == 3
 
-    @pytest.mark.asyncio
     async def test_controller_skips_checkpoints_when_dir_is_none(self) -> None:
         """T123: controller skips checkpoints when checkpoint_dir is None."""
         # Arrange
@@ -136,7 +130,6 @@ class TestRoundControllerRunSimulation:
         # Assert
         assert result.total_rounds == 3
 
-    @pytest.mark.asyncio
     async def test_controller_advances_round_number(self) -> None:
         """T125: controller advances round_number each round."""
         # Arrange
@@ -169,7 +162,6 @@ class TestRoundControllerRunSimulation:
         # (advance_round is called AFTER each round completes)
         assert round_numbers == [0, 1, 2]
 
-    @pytest.mark.asyncio
     async def test_controller_returns_simulation_result(self) -> None:
         """T127: controller returns SimulationResult with metrics."""
         # Arrange
@@ -194,7 +186,6 @@ class TestRoundControllerRunSimulation:
 class TestRoundControllerRunRound:
     """Tests for RoundController.run_round method."""
 
-    @pytest.mark.asyncio
     async def test_run_round_executes_single_round(self) -> None:
         """T129: run_round executes a single round."""
         # Arrange
@@ -213,7 +204,6 @@ class TestRoundControllerRunRound:
         assert round_result.round_number == 0
         assert len(round_result.decisions) == 1
 
-    @pytest.mark.asyncio
     async def test_run_round_processes_all_agents(self) -> None:
         """run_round processes all agents in the state."""
         # Arrange
@@ -231,11 +221,30 @@ class TestRoundControllerRunRound:
         assert len(round_result.decisions) == 3
         assert round_executor.execute.await_count == 3
 
+    async def test_run_round_clears_reasoner_round_cache(self) -> None:
+        """run_round clears the reasoner's per-round cache before processing."""
+        # Arrange
+        agent = create_mock_agent()
+        statechart = create_social_media_statechart()
+        reasoner = MagicMock()
+        state = SimulationState(
+            posts=[], agents=[agent], statechart=statechart, reasoner=reasoner
+        )
+
+        round_executor = create_mock_round_executor()
+        controller = RoundController(round_executor=round_executor)
+
+        # Act
+        await controller.run_round(state=state)
+        await controller.run_round(state=state)
+
+        # Assert
+        assert reasoner.clear_round_cache.call_count == 2
+
 
 class TestRoundControllerResumeFromCheckpoint:
     """Tests for RoundController.resume_from_checkpoint method."""
 
-    @pytest.mark.asyncio
     async def test_resume_from_checkpoint_loads_and_continues(
         self, tmp_path: Path
     ) -> None:
@@ -278,7 +287,6 @@ class TestRoundControllerResumeFromCheckpoint:
         # Executor called for rounds 5, 6, 7 (3 rounds × 1 agent)
         assert round_executor.execute.await_count == 3
 
-    @pytest.mark.asyncio
     async def test_resume_preserves_metrics(self, tmp_path: Path) -> None:
         """Resume preserves metrics from checkpoint."""
         # Arrange
@@ -4,7 +4,6 @@ from datetime import datetime
 from unittest.mock import MagicMock
 
 import pytest
-from pydantic import ValidationError
 
 
 class TestEngagementMetricsDefaults:
@@ -39,37 +38,37 @@ class TestEngagementMetricsDefaults:
         assert metrics.posts_created == 0
 
     def test_metrics_negative_total_likes_raises_error(self):
-        """total_likes < 0 should raise ValidationError."""
+        """total_likes < 0 should raise ValueError."""
         from prism.simulation.state import EngagementMetrics
 
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValueError) as exc_info:
             EngagementMetrics(total_likes=-1)
 
         assert "total_likes" in str(exc_info.value)
 
     def test_metrics_negative_total_reshares_raises_error(self):
-        """total_reshares < 0 should raise ValidationError."""
+        """total_reshares < 0 should raise ValueError."""
         from prism.simulation.state import EngagementMetrics
 
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValueError) as exc_info:
             EngagementMetrics(total_reshares=-1)
 
         assert "total_reshares" in str(exc_info.value)
 
     def test_metrics_negative_total_replies_raises_error(self):
-        """total_replies < 0 should raise ValidationError."""
+        """total_replies < 0 should raise ValueError."""
         from prism.simulation.state import EngagementMetrics
 
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValueError) as exc_info:
             EngagementMetrics(total_replies=-1)
 
         assert "total_replies" in str(exc_info.value)
 
     def test_metrics_negative_posts_created_raises_error(self):
-        """posts_created < 0 should raise ValidationError."""
+        """posts_created < 0 should raise ValueError."""
         from prism.simulation.state import EngagementMetrics
 
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValueError) as exc_info:
             EngagementMetrics(posts_created=-1)
 
         assert "posts_created" in str(exc_info.value)
@@ -385,3 +384,26 @@ class TestSimulationStateAdvanceRound:
         assert state.round_number == 1
         state.advance_round()
         assert state.round_number == 2
+
+
+class TestSimulationStateLayout:
+    """Test the runtime state models are plain slotted objects."""
+
+    def test_state_and_metrics_use_slots(self):
+        """SimulationState and EngagementMetrics should not carry a __dict__."""
+        from prism.simulation.state import EngagementMetrics, SimulationState
+        from prism.statechart.statechart import Statechart
+        from prism.statechart.states import AgentState
+
+        statechart = Statechart(
+            states={AgentState.IDLE},
+            transitions=[],
+            initial=AgentState.IDLE,
+        )
+        agent = MagicMock()
+        agent.state = AgentState.IDLE
+
+        state = SimulationState(agents=[agent], statechart=statechart)
+
+        assert not hasattr(state, "__dict__")
+        assert not hasattr(EngagementMetrics(), "__dict__")
@@ -9,8 +9,6 @@ These tests verify that all statechart components work together correctly:
 
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
-
 from prism.agents.social_agent import SocialAgent
 from prism.statechart import (
     AgentState,
@@ -249,7 +247,6 @@ class TestStatechartIntegration:
         assert agent.ticks_in_state == 0
         assert agent.is_timed_out() is False
 
-    @pytest.mark.asyncio
     async def test_reasoner_for_ambiguous_transitions(self) -> None:
         """Reasoner should decide between multiple valid target states."""
         mock_llm_client = MagicMock()
@@ -285,7 +282,6 @@ class TestStatechartIntegration:
         assert result in options
         assert result == AgentState.ENGAGING_LIKE  # Based on mock response
 
-    @pytest.mark.asyncio
     async def test_reasoner_fallback_on_parse_error(self) -> None:
         """Reasoner should fallback to first option on parse error."""
         mock_llm_client = MagicMock()
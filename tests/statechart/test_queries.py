@@ -2,7 +2,11 @@
 
 from unittest.mock import MagicMock
 
-from prism.statechart.queries import agents_in_state, state_distribution
+from prism.statechart.queries import (
+    agents_in_state,
+    pack_states,
+    state_distribution,
+)
 from prism.statechart.states import AgentState
 
 # =============================================================================
@@ -191,3 +195,60 @@ class TestStateDistribution:
         # Total should equal number of agents
         total = sum(result.values())
         assert total == 10
+
+
+# =============================================================================
+# Tests for packed state column queries
+# =============================================================================
+
+
+class TestPackedStateColumn:
+    """Tests for pack_states() and the vectorized query paths."""
+
+    def _make_agents(self, states: list[AgentState]) -> list[MagicMock]:
+        agents = []
+        for state in states:
+            agent = MagicMock()
+            agent.state = state
+            agents.append(agent)
+        return agents
+
+    def test_pack_states_returns_int8_column(self) -> None:
+        """pack_states() should return one int8 entry per agent."""
+        agents = self._make_agents([AgentState.IDLE, AgentState.RESTING])
+
+        column = pack_states(agents)
+
+        assert column.dtype.name == "int8"
+        assert len(column) == 2
+
+    def test_agents_in_state_column_matches_loop(self) -> None:
+        """agents_in_state() with a column should match the loop result."""
+        agents = self._make_agents(
+            [AgentState.IDLE, AgentState.IDLE, AgentState.SCROLLING]
+        )
+        column = pack_states(agents)
+
+        for state in AgentState:
+            assert agents_in_state(state, agents, state_column=column) == (
+                agents_in_state(state, agents)
+            )
+
+    def test_state_distribution_column_matches_loop(self) -> None:
+        """state_distribution() with a column should match the loop result."""
+        agents = self._make_agents(
+            [AgentState.IDLE, AgentState.ENGAGING_LIKE, AgentState.ENGAGING_LIKE]
+        )
+        column = pack_states(agents)
+
+        assert state_distribution(agents, state_column=column) == (
+            state_distribution(agents)
+        )
+
+    def test_state_distribution_empty_column_has_all_states(self) -> None:
+        """An empty column should still report every state with zero count."""
+        column = pack_states([])
+
+        distribution = state_distribution([], state_column=column)
+
+        assert distribution == {state: 0 for state in AgentState}
@@ -4,6 +4,7 @@ This module tests the Reasoner component that resolves ambiguous state
 transitions using LLM inference.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -157,7 +158,6 @@ class TestBuildReasonerPrompt:
 class TestStatechartReasonerDecide:
     """Tests for StatechartReasoner.decide() method."""
 
-    @pytest.mark.asyncio
     async def test_decide_returns_agent_state(self) -> None:
         """decide() returns an AgentState from options."""
         from prism.statechart.reasoner import StatechartReasoner
@@ -182,7 +182,6 @@ class TestStatechartReasonerDecide:
 
         assert result == AgentState.COMPOSING
 
-    @pytest.mark.asyncio
     async def test_decide_calls_llm_with_prompt(self) -> None:
         """decide() calls LLM client with constructed prompt."""
         from prism.statechart.reasoner import StatechartReasoner
@@ -210,7 +209,6 @@ class TestStatechartReasonerDecide:
         prompt = call_args[0][0] if call_args[0] else call_args[1].get("prompt", "")
         assert "Alice" in prompt
 
-    @pytest.mark.asyncio
     async def test_decide_parses_json_response(self) -> None:
         """decide() correctly parses JSON response from LLM."""
         from prism.statechart.reasoner import StatechartReasoner
@@ -243,7 +241,6 @@ class TestStatechartReasonerDecide:
 class TestStatechartReasonerErrorHandling:
     """Tests for reasoner error handling."""
 
-    @pytest.mark.asyncio
     async def test_json_parse_error_returns_fallback(self) -> None:
         """JSON parse error returns fallback state (first option)."""
         from prism.statechart.reasoner import StatechartReasoner
@@ -268,7 +265,6 @@ class TestStatechartReasonerErrorHandling:
         # Should fallback to first option
         assert result == AgentState.SCROLLING
 
-    @pytest.mark.asyncio
     async def test_invalid_state_in_response_returns_fallback(self) -> None:
         """Invalid state value in response returns fallback."""
         from prism.statechart.reasoner import StatechartReasoner
@@ -293,7 +289,6 @@ class TestStatechartReasonerErrorHandling:
         # Should fallback to first option
         assert result == AgentState.COMPOSING
 
-    @pytest.mark.asyncio
     async def test_state_not_in_options_returns_fallback(self) -> None:
         """State that is valid but not in options returns fallback."""
         from prism.statechart.reasoner import StatechartReasoner
@@ -344,7 +339,6 @@ class TestStatechartReasonerErrorHandling:
                 )
             )
 
-    @pytest.mark.asyncio
     async def test_missing_next_state_key_returns_fallback(self) -> None:
         """Missing next_state key in JSON returns fallback."""
         from prism.statechart.reasoner import StatechartReasoner
@@ -368,3 +362,310 @@ class TestStatechartReasonerErrorHandling:
 
         # Should fallback to first option
         assert result == AgentState.IDLE
+
+
+# =============================================================================
+# Tests for StatechartReasoner.decide_batch()
+# =============================================================================
+
+
+class TestStatechartReasonerDecideBatch:
+    """Tests for concurrent batch decisions."""
+
+    async def test_decide_batch_returns_results_in_request_order(self) -> None:
+        """decide_batch() returns one state per request, in request order."""
+        from prism.statechart.reasoner import StatechartReasoner
+
+        mock_client = MagicMock()
+        mock_client.run = AsyncMock(
+            side_effect=[
+                '{"next_state": "engaging_like"}',
+                '{"next_state": "composing"}',
+            ]
+        )
+
+        reasoner = StatechartReasoner(client=mock_client)
+        alice = MagicMock()
+        alice.name = "Alice"
+        alice.interests = ["tech"]
+        alice.personality = "curious"
+        bob = MagicMock()
+        bob.name = "Bob"
+        bob.interests = ["music"]
+        bob.personality = "enthusiastic"
+        options = [AgentState.ENGAGING_LIKE, AgentState.COMPOSING]
+
+        results = await reasoner.decide_batch(
+            [
+                (alice, AgentState.EVALUATING, "decides", options, None),
+                (bob, AgentState.EVALUATING, "decides", options, None),
+            ]
+        )
+
+        assert results == [AgentState.ENGAGING_LIKE, AgentState.COMPOSING]
+        assert mock_client.run.call_count == 2
+
+    async def test_decide_batch_failure_falls_back_per_request(self) -> None:
+        """A failing LLM call only falls back for its own request."""
+        from prism.statechart.reasoner import StatechartReasoner
+
+        mock_client = MagicMock()
+        mock_client.run = AsyncMock(
+            side_effect=[
+                RuntimeError("connection reset"),
+                '{"next_state": "composing"}',
+            ]
+        )
+
+        reasoner = StatechartReasoner(client=mock_client, coalesce=False)
+        mock_agent = MagicMock()
+        mock_agent.name = "Bob"
+        mock_agent.interests = ["music"]
+        mock_agent.personality = "enthusiastic"
+        options = [AgentState.SCROLLING, AgentState.COMPOSING]
+
+        results = await reasoner.decide_batch(
+            [
+                (mock_agent, AgentState.EVALUATING, "decides", options, None),
+                (mock_agent, AgentState.EVALUATING, "decides", options, None),
+            ],
+            concurrency=1,
+        )
+
+        assert results == [AgentState.SCROLLING, AgentState.COMPOSING]
+
+    async def test_decide_batch_rejects_invalid_concurrency(self) -> None:
+        """decide_batch() raises ValueError when concurrency < 1."""
+        from prism.statechart.reasoner import StatechartReasoner
+
+        reasoner = StatechartReasoner(client=MagicMock())
+
+        with pytest.raises(ValueError, match="concurrency"):
+            await reasoner.decide_batch([], concurrency=0)
+
+
+# =============================================================================
+# Tests for in-round prompt coalescing
+# =============================================================================
+
+
+class TestStatechartReasonerCoalescing:
+    """Tests for sharing decisions between same-profile agents within a round."""
+
+    async def test_same_profile_agents_share_one_llm_call(self) -> None:
+        """Agents differing only by name collapse to a single LLM call."""
+        from prism.statechart.reasoner import StatechartReasoner
+
+        mock_client = MagicMock()
+        mock_client.run = AsyncMock(return_value='{"next_state": "composing"}')
+
+        reasoner = StatechartReasoner(client=mock_client, coalesce=True)
+        requests = []
+        for name in ("Alice", "Bob", "Carol"):
+            mock_agent = MagicMock()
+            mock_agent.name = name
+            mock_agent.interests = ["tech"]
+            mock_agent.personality = "curious"
+            requests.append(
+                (
+                    mock_agent,
+                    AgentState.EVALUATING,
+                    "decides",
+                    [AgentState.SCROLLING, AgentState.COMPOSING],
+                    None,
+                )
+            )
+
+        results = await reasoner.decide_batch(requests)
+        again = await reasoner.decide(*requests[0])
+
+        assert results == [AgentState.COMPOSING] * 3
+        assert again == AgentState.COMPOSING
+        mock_client.run.assert_awaited_once()
+
+    async def test_different_profiles_get_separate_llm_calls(self) -> None:
+        """Agents with different interests or personality are not coalesced."""
+        from prism.statechart.reasoner import StatechartReasoner
+
+        mock_client = MagicMock()
+        mock_client.run = AsyncMock(return_value='{"next_state": "composing"}')
+
+        reasoner = StatechartReasoner(client=mock_client, coalesce=True)
+        requests = []
+        for interests, personality in (
+            (["tech"], "curious"),
+            (["cooking"], "curious"),
+            (["tech"], "grumpy"),
+        ):
+            mock_agent = MagicMock()
+            mock_agent.name = "Alice"
+            mock_agent.interests = interests
+            mock_agent.personality = personality
+            requests.append(
+                (
+                    mock_agent,
+                    AgentState.EVALUATING,
+                    "decides",
+                    [AgentState.SCROLLING, AgentState.COMPOSING],
+                    None,
+                )
+            )
+
+        await reasoner.decide_batch(requests)
+
+        assert mock_client.run.await_count == 3
+
+    async def test_coalescing_is_off_by_default(self) -> None:
+        """Without coalesce=True every call reaches the LLM and nothing is cached."""
+        from prism.statechart.reasoner import StatechartReasoner
+
+        mock_client = MagicMock()
+        mock_client.run = AsyncMock(return_value='{"next_state": "composing"}')
+
+        reasoner = StatechartReasoner(client=mock_client)
+        mock_agent = MagicMock()
+        mock_agent.name = "Alice"
+        mock_agent.interests = ["tech"]
+        mock_agent.personality = "curious"
+        request = (
+            mock_agent,
+            AgentState.EVALUATING,
+            "decides",
+            [AgentState.SCROLLING, AgentState.COMPOSING],
+            None,
+        )
+
+        await reasoner.decide(*request)
+        await reasoner.decide(*request)
+
+        assert mock_client.run.await_count == 2
+        assert reasoner._round_cache == {}
+
+    async def test_clear_round_cache_forces_new_llm_call(self) -> None:
+        """clear_round_cache() makes the next identical prompt hit the LLM."""
+        from prism.statechart.reasoner import StatechartReasoner
+
+        mock_client = MagicMock()
+        mock_client.run = AsyncMock(
+            side_effect=['{"next_state": "composing"}', '{"next_state": "scrolling"}']
+        )
+
+        reasoner = StatechartReasoner(client=mock_client, coalesce=True)
+        mock_agent = MagicMock()
+        mock_agent.name = "Alice"
+        mock_agent.interests = ["tech"]
+        mock_agent.personality = "curious"
+        request = (
+            mock_agent,
+            AgentState.EVALUATING,
+            "decides",
+            [AgentState.SCROLLING, AgentState.COMPOSING],
+            None,
+        )
+
+        first = await reasoner.decide(*request)
+        reasoner.clear_round_cache()
+        second = await reasoner.decide(*request)
+
+        assert first == AgentState.COMPOSING
+        assert second == AgentState.SCROLLING
+        assert mock_client.run.await_count == 2
+
+    async def test_coalescing_can_be_disabled(self) -> None:
+        """With coalesce=False every call reaches the LLM."""
+        from prism.statechart.reasoner import StatechartReasoner
+
+        mock_client = MagicMock()
+        mock_client.run = AsyncMock(return_value='{"next_state": "composing"}')
+
+        reasoner = StatechartReasoner(client=mock_client, coalesce=False)
+        mock_agent = MagicMock()
+        mock_agent.name = "Alice"
+        mock_agent.interests = ["tech"]
+        mock_agent.personality = "curious"
+        request = (
+            mock_agent,
+            AgentState.EVALUATING,
+            "decides",
+            [AgentState.SCROLLING, AgentState.COMPOSING],
+            None,
+        )
+
+        await reasoner.decide(*request)
+        await reasoner.decide(*request)
+
+        assert mock_client.run.await_count == 2
+
+    async def test_cancelled_owner_lets_waiters_call_the_llm(self) -> None:
+        """Cancelling the call that owns a prompt doesn't cancel its waiters."""
+        from prism.statechart.reasoner import StatechartReasoner
+
+        never = asyncio.Event()
+
+        async def run(prompt: str) -> str:
+            if mock_client.run.await_count == 1:
+                await never.wait()
+            return '{"next_state": "composing"}'
+
+        mock_client = MagicMock()
+        mock_client.run = AsyncMock(side_effect=run)
+
+        reasoner = StatechartReasoner(client=mock_client, coalesce=True)
+        mock_agent = MagicMock()
+        mock_agent.name = "Alice"
+        mock_agent.interests = ["tech"]
+        mock_agent.personality = "curious"
+        request = (
+            mock_agent,
+            AgentState.EVALUATING,
+            "decides",
+            [AgentState.SCROLLING, AgentState.COMPOSING],
+            None,
+        )
+
+        owner = asyncio.create_task(reasoner.decide(*request))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(reasoner.decide(*request))
+        await asyncio.sleep(0)
+        owner.cancel()
+
+        assert await waiter == AgentState.COMPOSING
+        assert owner.cancelled()
+        assert mock_client.run.await_count == 2
+
+    async def test_cancelled_waiter_leaves_owner_running(self) -> None:
+        """Cancelling a waiter doesn't cancel the shared call it waits on."""
+        from prism.statechart.reasoner import StatechartReasoner
+
+        release = asyncio.Event()
+
+        async def run(prompt: str) -> str:
+            await release.wait()
+            return '{"next_state": "composing"}'
+
+        mock_client = MagicMock()
+        mock_client.run = AsyncMock(side_effect=run)
+
+        reasoner = StatechartReasoner(client=mock_client, coalesce=True)
+        mock_agent = MagicMock()
+        mock_agent.name = "Alice"
+        mock_agent.interests = ["tech"]
+        mock_agent.personality = "curious"
+        request = (
+            mock_agent,
+            AgentState.EVALUATING,
+            "decides",
+            [AgentState.SCROLLING, AgentState.COMPOSING],
+            None,
+        )
+
+        owner = asyncio.create_task(reasoner.decide(*request))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(reasoner.decide(*request))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+
+        assert await owner == AgentState.COMPOSING
+        assert waiter.cancelled()
+        mock_client.run.assert_awaited_once()
@@ -24,7 +24,7 @@ class TestStatechartInit:
         sc = Statechart(states=states, transitions=transitions, initial=initial)
 
         assert sc.states == states
-        assert sc.transitions == transitions
+        assert sc.transitions == tuple(transitions)
         assert sc.initial == initial
 
     def test_statechart_validates_initial_in_states(self):
@@ -81,7 +81,7 @@ class TestStatechartInit:
         initial = AgentState.IDLE
 
         sc = Statechart(states=states, transitions=transitions, initial=initial)
-        assert sc.transitions == []
+        assert sc.transitions == ()
 
     def test_statechart_with_multiple_transitions(self):
         """Statechart should accept multiple transitions."""
@@ -108,6 +108,26 @@ class TestStatechartInit:
         sc = Statechart(states=states, transitions=transitions, initial=initial)
         assert len(sc.transitions) == 3
 
+    def test_statechart_interns_trigger_names(self):
+        """Statechart should store transitions as a tuple with interned triggers."""
+        import sys
+
+        from prism.statechart.statechart import Statechart
+
+        # Build the trigger at runtime so it is not a compile-time constant
+        trigger = "".join(["start", "_", "browsing"])
+        states = {AgentState.IDLE, AgentState.SCROLLING}
+        transitions = [
+            Transition(
+                trigger=trigger, source=AgentState.IDLE, target=AgentState.SCROLLING
+            )
+        ]
+
+        sc = Statechart(states=states, transitions=transitions, initial=AgentState.IDLE)
+
+        assert isinstance(sc.transitions, tuple)
+        assert sc.transitions[0].trigger is sys.intern("start_browsing")
+
 
 class TestStatechartFire:
     """Tests for Statechart.fire() (T009)."""
@@ -732,3 +752,112 @@ class TestStatechartValidTargets:
             AgentState.ENGAGING_REPLY,
             AgentState.ENGAGING_RESHARE,
         }
+
+    def test_valid_targets_returns_independent_copies(self):
+        """valid_targets() results should not share state with the cached index."""
+        from prism.statechart.statechart import Statechart
+
+        states = {AgentState.IDLE, AgentState.SCROLLING}
+        transitions = [
+            Transition(
+                trigger="start", source=AgentState.IDLE, target=AgentState.SCROLLING
+            )
+        ]
+        sc = Statechart(states=states, transitions=transitions, initial=AgentState.IDLE)
+
+        targets = sc.valid_targets(AgentState.IDLE, "start")
+        targets.append(AgentState.IDLE)
+        triggers = sc.valid_triggers(AgentState.IDLE)
+        triggers.clear()
+
+        assert sc.valid_targets(AgentState.IDLE, "start") == [AgentState.SCROLLING]
+        assert sc.valid_triggers(AgentState.IDLE) == ["start"]
+
+
+class TestStatechartCompile:
+    """Tests for Statechart.compile() specialized fire functions."""
+
+    def _build(self, transitions):
+        from prism.statechart.statechart import Statechart
+
+        return Statechart(
+            states=set(AgentState), transitions=transitions, initial=AgentState.IDLE
+        )
+
+    def test_compiled_fire_matches_generic_fire(self):
+        """Compiled fire should agree with generic fire for every input."""
+
+        def raising_guard(agent, context):
+            raise RuntimeError("boom")
+
+        transitions = [
+            Transition(
+                trigger="go", source=AgentState.IDLE, target=AgentState.SCROLLING
+            ),
+            Transition(
+                trigger="decide",
+                source=AgentState.EVALUATING,
+                target=AgentState.COMPOSING,
+                guard=raising_guard,
+            ),
+            Transition(
+                trigger="decide",
+                source=AgentState.EVALUATING,
+                target=AgentState.ENGAGING_LIKE,
+                guard=lambda a, c: c is not None and c.get("like"),
+            ),
+            Transition(
+                trigger="decide",
+                source=AgentState.EVALUATING,
+                target=AgentState.SCROLLING,
+            ),
+            Transition(
+                trigger="decide",
+                source=AgentState.EVALUATING,
+                target=AgentState.RESTING,
+            ),
+        ]
+        generic = self._build(transitions)
+        compiled = self._build(transitions)
+        compiled.compile()
+
+        for trigger in ("go", "decide", "missing"):
+            for state in AgentState:
+                for context in (None, {"like": True}, {"like": False}):
+                    assert compiled.fire(trigger, state, None, context) == (
+                        generic.fire(trigger, state, None, context)
+                    )
+
+    def test_compiled_fire_runs_action_and_swallows_errors(self):
+        """Compiled fire should run actions and ignore action exceptions."""
+        calls = []
+
+        def failing_action(agent, context):
+            calls.append((agent, context))
+            raise RuntimeError("action failed")
+
+        sc = self._build(
+            [
+                Transition(
+                    trigger="go",
+                    source=AgentState.IDLE,
+                    target=AgentState.SCROLLING,
+                    action=failing_action,
+                )
+            ]
+        )
+        fire = sc.compile()
+
+        result = fire("go", AgentState.IDLE, "agent", {"k": 1})
+
+        assert result == AgentState.SCROLLING
+        assert calls == [("agent", {"k": 1})]
+
+    def test_compile_is_cached(self):
+        """compile() should build the function once and reuse it."""
+        sc = self._build([])
+
+        fire = sc.compile()
+
+        assert sc.compile() is fire
+        assert fire("anything", AgentState.IDLE, None, None) is None
@@ -85,6 +85,19 @@ class TestTransition:
         with pytest.raises(FrozenInstanceError):
             t.trigger = "modified"
 
+    def test_transition_uses_slots_and_pickles(self):
+        """Transition should have no __dict__ and survive a pickle round-trip."""
+        import pickle
+
+        from prism.statechart.transitions import Transition
+
+        t = Transition(
+            trigger="test", source=AgentState.IDLE, target=AgentState.SCROLLING
+        )
+
+        assert not hasattr(t, "__dict__")
+        assert pickle.loads(pickle.dumps(t)) == t
+
     def test_transition_with_guard_callable(self):
         """Transition should accept a callable as guard."""
         from prism.statechart.transitions import Transition
@@ -256,3 +269,20 @@ class TestStateTransition:
             timestamp=now,
         )
         assert isinstance(st.timestamp, datetime)
+
+    def test_state_transition_uses_slots_and_pickles(self):
+        """StateTransition should have no __dict__ and survive pickling."""
+        import pickle
+
+        from prism.statechart.transitions import StateTransition
+
+        st = StateTransition(
+            from_state=AgentState.IDLE,
+            to_state=AgentState.SCROLLING,
+            trigger="start",
+            timestamp=datetime.now(timezone.utc),
+            context={"round": 1},
+        )
+
+        assert not hasattr(st, "__dict__")
+        assert pickle.loads(pickle.dumps(st)) == st